@@ -0,0 +1,2 @@
+from .model import AugmentedAVLTree
+from .monoid import Monoid, SUM, MIN, MAX, COUNT, MEAN
\ No newline at end of file
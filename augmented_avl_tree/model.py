@@ -0,0 +1,364 @@
+from typing import Any
+from .node import Node
+from .monoid import Monoid, SUM
+from .exception import Empty
+
+
+class AugmentedAVLTree:
+    """
+    AVL Tree whose nodes cache a monoid aggregate of their subtree.
+
+    Every node keeps `aggregate`, the combination of `monoid.lift(value, count)`
+    over its subtree in key order. Insertion, deletion and the rotations
+    recompute it from the children, so `aggregate(lo, hi)` only has to
+    combine O(log n) cached values instead of scanning the range.
+
+    Attributes
+    ----------
+    root : Node
+        Root node of the AVL tree.
+    monoid : Monoid
+        Aggregate maintained in every node.
+    __size : int
+        Total number of elements in the tree (including duplicates).
+    __node_count : int
+        Total number of nodes in the tree (excluding duplicates).
+    """
+
+    def __init__(self, monoid: Monoid = SUM, /):
+
+        self.root = None
+        self.monoid = monoid
+        self.__size = 0
+        self.__node_count = 0
+
+    def node_count(self) -> int:
+        """
+        Returns the total number of distinct nodes in the AVL tree,
+        excluding duplicates.
+
+        Returns
+        -------
+        int
+            Number of unique nodes in the tree.
+        """
+
+        return self.__node_count
+
+    def size(self) -> int:
+        """
+        Returns the total number of elements in the AVL tree,
+        including duplicates.
+
+        Returns
+        -------
+        int
+            Total count of elements stored in the tree.
+        """
+
+        return self.__size
+
+    def is_empty(self):
+        """
+        Checks if the AVL tree is empty.
+        Raises an Empty exception if the tree has no nodes.
+        """
+
+        if self.__node_count == 0:
+            raise Empty('AugmentedAVLTree is empty')
+
+    def insert(self, value: Any, /):
+        """
+        Inserts a new value into the AVL tree.
+        If the value already exists, increments its count.
+        Aggregates are refreshed on the way back up, including inside rotations.
+        """
+
+        self.root = self.__insert_helper(self.root, value)
+
+    def __insert_helper(self, node: Node | None, value: Any, /) -> Node:
+        """
+        Helper function for insertion. Works recursively.
+
+        Returns
+        -------
+        Node
+            The updated node (may be the new root after rotation).
+        """
+
+        if node is None:
+            self.__size += 1
+            self.__node_count += 1
+            node = Node(value)
+            self.__update(node)
+            return node
+        if value < node.value:
+            node.left = self.__insert_helper(node.left, value)
+        elif node.value < value:
+            node.right = self.__insert_helper(node.right, value)
+        else:
+            node.count += 1
+            self.__size += 1
+        return self.__rebalance(node)
+
+    def delete(self, value: Any, /):
+        """
+        Deletes a value from the AVL tree.
+        Decreases the count if duplicates exist and rebalances after removal.
+        """
+
+        self.is_empty()
+        self.root = self.__delete_helper(self.root, value)
+
+    def __delete_helper(self, node: Node | None, value: Any, /) -> Node | None:
+
+        if node is None:
+            return None
+        if value < node.value:
+            node.left = self.__delete_helper(node.left, value)
+        elif node.value < value:
+            node.right = self.__delete_helper(node.right, value)
+        elif node.count > 1:
+            node.count -= 1
+            self.__size -= 1
+        elif node.left and node.right:
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.value, node.count = successor.value, successor.count
+            successor.count = 1
+            node.right = self.__delete_helper(node.right, node.value)
+        else:
+            self.__size -= 1
+            self.__node_count -= 1
+            return node.left or node.right
+        return self.__rebalance(node)
+
+    def __rebalance(self, node: Node, /) -> Node:
+        """
+        Restores the AVL property at `node` and refreshes its height and aggregate.
+
+        Returns
+        -------
+        Node
+            The new root of the subtree.
+        """
+
+        bf = self.get_balance(node)
+        if bf < -1:
+            if self.get_balance(node.right) <= 0: # right-right
+                return self.__rotate_left(node)
+            else: # right-left
+                node.right = self.__rotate_right(node.right)
+                return self.__rotate_left(node)
+        elif 1 < bf:
+            if 0 <= self.get_balance(node.left): # left-left
+                return self.__rotate_right(node)
+            else: # left-right
+                node.left = self.__rotate_left(node.left)
+                return self.__rotate_right(node)
+        self.__update(node)
+        return node
+
+    def __update(self, node: Node, /):
+        """
+        Recomputes the height and aggregate of a node from its children.
+        """
+
+        monoid = self.monoid
+        left, right = node.left, node.right
+        node.height = 1 + max(left.height if left else 0, right.height if right else 0)
+        aggregate = monoid.lift(node.value, node.count)
+        if left:
+            aggregate = monoid.combine(left.aggregate, aggregate)
+        if right:
+            aggregate = monoid.combine(aggregate, right.aggregate)
+        node.aggregate = aggregate
+
+    def __rotate_left(self, x: Node, /) -> Node:
+        """
+        Performs a Left rotation (RR case).
+
+        Returns
+        -------
+        Node
+            The new root of the rotated subtree.
+        """
+
+        y = x.right
+        x.right = y.left
+        y.left = x
+        self.__update(x)
+        self.__update(y)
+        return y
+
+    def __rotate_right(self, x: Node, /) -> Node:
+        """
+        Performs a Right rotation (LL case).
+
+        Returns
+        -------
+        Node
+            The new root of the rotated subtree.
+        """
+
+        y = x.left
+        x.left = y.right
+        y.right = x
+        self.__update(x)
+        self.__update(y)
+        return y
+
+    def get_balance(self, node: Node | None, /) -> int:
+        """
+        Calculates the balance factor (BF) of a node.
+
+        Returns
+        -------
+        int
+            BF = height(left) - height(right)
+        """
+
+        if node is None:
+            return 0
+        return (node.left.height if node.left else 0) - (node.right.height if node.right else 0)
+
+    def aggregate(self, lo: Any = None, hi: Any = None, /) -> Any:
+        """
+        Returns the aggregate of all values `v` with `lo <= v <= hi`,
+        duplicates weighted by their count. A bound left as None is unbounded.
+
+        Returns
+        -------
+        Any
+            The finalized aggregate (the monoid identity, finalized, for an empty range).
+        """
+
+        return self.monoid.finalize(self.__aggregate_helper(self.root, lo, hi))
+
+    def __aggregate_helper(self, node: Node | None, lo: Any, hi: Any, /) -> Any:
+        """
+        Recursive helper for aggregate(). Once the search paths for `lo` and `hi`
+        split, each side has a single open bound and only follows one path,
+        combining the cached aggregates of the subtrees it passes.
+        """
+
+        monoid = self.monoid
+        while node:
+            if lo is None and hi is None:
+                return node.aggregate
+            if lo is not None and node.value < lo:
+                node = node.right
+            elif hi is not None and hi < node.value:
+                node = node.left
+            else:
+                aggregate = monoid.lift(node.value, node.count)
+                if node.left:
+                    aggregate = monoid.combine(self.__aggregate_helper(node.left, lo, None), aggregate)
+                if node.right:
+                    aggregate = monoid.combine(aggregate, self.__aggregate_helper(node.right, None, hi))
+                return aggregate
+        return monoid.identity
+
+    def search(self, value: Any, /) -> Node:
+        """
+        Searches for a value in the AVL tree.
+
+        Returns
+        -------
+        Node | None
+            Returns the node containing the value, or None if not found.
+        """
+
+        current = self.root
+        while current:
+            if value < current.value:
+                current = current.left
+            elif current.value < value:
+                current = current.right
+            else:
+                break
+        return current
+
+    def min(self):
+        """
+        Returns the minimum value in the AVL tree.
+
+        Returns
+        -------
+        Any
+            The minimum value.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.left:
+            current = current.left
+        return current.value
+
+    def max(self):
+        """
+        Returns the maximum value in the AVL tree.
+
+        Returns
+        -------
+        Any
+            The maximum value.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.right:
+            current = current.right
+        return current.value
+
+    def in_order(self) -> list:
+        """
+        Returns values of the tree in in-order traversal.
+        """
+
+        arr = []
+        self.__in_order_helper(self.root, arr)
+        return arr
+
+    def __in_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        self.__in_order_helper(node.left, arr)
+        arr.append(node.value)
+        self.__in_order_helper(node.right, arr)
+
+    def pre_order(self) -> list:
+        """
+        Returns values of the tree in pre-order traversal.
+        """
+
+        arr = []
+        self.__pre_order_helper(self.root, arr)
+        return arr
+
+    def __pre_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        arr.append(node.value)
+        self.__pre_order_helper(node.left, arr)
+        self.__pre_order_helper(node.right, arr)
+
+    def post_order(self) -> list:
+        """
+        Returns values of the tree in post-order traversal.
+        """
+
+        arr = []
+        self.__post_order_helper(self.root, arr)
+        return arr
+
+    def __post_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        self.__post_order_helper(node.left, arr)
+        self.__post_order_helper(node.right, arr)
+        arr.append(node.value)
\ No newline at end of file
@@ -0,0 +1,67 @@
+from typing import Any, Callable
+
+
+class Monoid:
+    """
+    Associative aggregate cached in every node of an AugmentedAVLTree.
+
+    Attributes
+    ----------
+    identity : Any
+        Neutral element, the aggregate of an empty subtree.
+    combine : Callable[[Any, Any], Any]
+        Associative binary operation. It is always called with the left
+        operand before the right one in key order, so it does not need to be commutative.
+    lift : Callable[[Any, int], Any]
+        Turns a stored value and its duplicate count into an aggregate.
+    finalize : Callable[[Any], Any]
+        Maps the combined aggregate to the result returned to callers.
+    """
+
+    def __init__(
+        self,
+        identity: Any,
+        combine: Callable[[Any, Any], Any],
+        lift: Callable[[Any, int], Any],
+        finalize: Callable[[Any], Any] | None = None,
+        /,
+    ):
+
+        self.identity = identity
+        self.combine = combine
+        self.lift = lift
+        self.finalize = finalize if finalize is not None else (lambda aggregate: aggregate)
+
+
+def _min(a: Any, b: Any, /) -> Any:
+
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return b if b < a else a
+
+
+def _max(a: Any, b: Any, /) -> Any:
+
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return b if a < b else a
+
+
+SUM = Monoid(0, lambda a, b: a + b, lambda value, count: value * count)
+
+MIN = Monoid(None, _min, lambda value, count: value)
+
+MAX = Monoid(None, _max, lambda value, count: value)
+
+COUNT = Monoid(0, lambda a, b: a + b, lambda value, count: count)
+
+MEAN = Monoid(
+    (0, 0),
+    lambda a, b: (a[0] + b[0], a[1] + b[1]),
+    lambda value, count: (value * count, count),
+    lambda aggregate: aggregate[0] / aggregate[1] if aggregate[1] else None,
+)
\ No newline at end of file
@@ -0,0 +1,325 @@
+from typing import Any, Iterator
+from .node import Node
+from .exception import ConcurrentModification
+
+
+END = object() # returned by next_value() and prev_value() once the cursor steps off an end
+
+
+class Cursor:
+    """
+    Bidirectional cursor over the live values of an AVLTree.
+
+    The cursor keeps its current node on top of a stack, above the ancestors
+    it will still visit in its direction of travel: those whose left subtree
+    holds the node when moving forward, or whose right subtree holds it when
+    moving backward. A step pops the current node and pushes the spine of its
+    next subtree, so a full walk pushes and pops every node once: O(1)
+    amortized per step and O(log n) for a single step. Changing direction
+    rebuilds the stack from the root in O(log n). Tombstones left by lazy
+    deletion are skipped.
+
+    Every tree mutation invalidates the stack (a rotation can move any node),
+    so the cursor records tree.modifications() and raises
+    ConcurrentModification once the tree has been changed by anything other
+    than this cursor's own delete_here().
+
+    When it steps past either end, the cursor becomes invalid. Stepping back
+    from there re-enters at the nearest end.
+
+    next_value() and prev_value() are the low-overhead stepping path: one
+    modification check per step, returning the new value or Cursor.END.
+
+    Attributes
+    ----------
+    __tree : AVLTree
+        The tree being walked.
+    __stack : list
+        Ancestors still ahead, then the current node; empty when the cursor is invalid.
+    __reverse : bool
+        Direction the stack is built for: False for next(), True for prev().
+    __side : int
+        Which end an invalid cursor fell off: -1 before the first value, 1 past the last.
+    __expected : int
+        Tree modification counter the stack is valid for.
+    __lazy : bool
+        True if the tree held tombstones when the stack was built. Tombstones only
+        appear through modifications, so this holds for as long as the stack does.
+    """
+
+    END = END
+
+    def __init__(self, tree, seek: Any = None, /):
+
+        self.__tree = tree
+        self.__modifications = tree.modifications
+        self.__stack = []
+        self.__reverse = False
+        self.__side = 1
+        if seek is None:
+            self.first()
+        else:
+            self.seek(seek)
+
+    def __reset(self, reverse: bool, /) -> list:
+        """
+        Starts an empty stack for a direction and records the modification counter.
+        """
+
+        self.__expected = self.__modifications()
+        self.__lazy = self.__tree.tombstones() > 0
+        self.__reverse = reverse
+        self.__stack = []
+        return self.__stack
+
+    def __descend(self, node: Node | None, reverse: bool, /):
+        """
+        Pushes node and its leftmost (or, with reverse, rightmost) spine.
+        """
+
+        while node:
+            self.__stack.append(node)
+            node = node.right if reverse else node.left
+
+    def __step(self, reverse: bool, /):
+        """
+        Moves to the in-order successor (or, with reverse, predecessor) node,
+        tombstones included, on a stack built for that direction.
+        Empties the stack when there is none.
+        """
+
+        node = self.__stack.pop()
+        self.__descend(node.left if reverse else node.right, reverse)
+
+    def __skip_tombstones(self, reverse: bool, /):
+
+        if self.__lazy:
+            while self.__stack and self.__stack[-1].count == 0:
+                self.__step(reverse)
+        if not self.__stack:
+            self.__side = -1 if reverse else 1
+
+    def __turn(self):
+        """
+        Rebuilds the stack around the current node for the other direction.
+        """
+
+        target = self.__stack[-1]
+        value = target.value
+        reverse = self.__reverse = not self.__reverse
+        stack = self.__stack = []
+        current = self.__tree.root
+        while current is not target:
+            if current.value < value:
+                if reverse:
+                    stack.append(current)
+                current = current.right
+            else:
+                if not reverse:
+                    stack.append(current)
+                current = current.left
+        stack.append(target)
+
+    def first(self) -> bool:
+        """
+        Positions the cursor on the smallest value.
+
+        Returns
+        -------
+        bool
+            True if the cursor is on a value.
+        """
+
+        self.__reset(False)
+        self.__descend(self.__tree.root, False)
+        self.__skip_tombstones(False)
+        return bool(self.__stack)
+
+    def last(self) -> bool:
+        """
+        Positions the cursor on the largest value.
+
+        Returns
+        -------
+        bool
+            True if the cursor is on a value.
+        """
+
+        self.__reset(True)
+        self.__descend(self.__tree.root, True)
+        self.__skip_tombstones(True)
+        return bool(self.__stack)
+
+    def seek(self, value: Any, /) -> bool:
+        """
+        Positions the cursor on the smallest value >= `value` in O(log n).
+
+        Returns
+        -------
+        bool
+            True if the cursor is on a value, False if every value is smaller.
+        """
+
+        stack = self.__reset(False)
+        current = self.__tree.root
+        while current:
+            if current.value < value:
+                current = current.right
+            else:
+                stack.append(current)
+                if not value < current.value:
+                    break
+                current = current.left
+        self.__skip_tombstones(False)
+        return bool(stack)
+
+    def valid(self) -> bool:
+        """
+        Returns True if the cursor is positioned on a value.
+        """
+
+        if self.__modifications() != self.__expected:
+            raise ConcurrentModification('tree was modified outside this cursor')
+        return bool(self.__stack)
+
+    def next(self) -> bool:
+        """
+        Moves to the next larger value.
+
+        Returns
+        -------
+        bool
+            True if the cursor is on a value, False once it has passed the largest one.
+        """
+
+        return self.next_value() is not END
+
+    def prev(self) -> bool:
+        """
+        Moves to the next smaller value.
+
+        Returns
+        -------
+        bool
+            True if the cursor is on a value, False once it has passed the smallest one.
+        """
+
+        return self.prev_value() is not END
+
+    def next_value(self) -> Any:
+        """
+        Moves to the next larger value and returns it, with a single
+        modification check. Use this on hot paths such as merge-joins.
+
+        Returns
+        -------
+        Any
+            The new value under the cursor, or Cursor.END once it has passed the largest one.
+        """
+
+        if self.__modifications() != self.__expected:
+            raise ConcurrentModification('tree was modified outside this cursor')
+        stack = self.__stack
+        if not stack:
+            return self.__stack[-1].value if self.__side < 0 and self.first() else END
+        if self.__reverse:
+            self.__turn()
+            stack = self.__stack
+        child = stack.pop().right
+        while child: # same walk as __step, inlined on the hot path
+            stack.append(child)
+            child = child.left
+        if self.__lazy or not stack:
+            self.__skip_tombstones(False)
+            if not stack:
+                return END
+        return stack[-1].value
+
+    def prev_value(self) -> Any:
+        """
+        Moves to the next smaller value and returns it, with a single
+        modification check.
+
+        Returns
+        -------
+        Any
+            The new value under the cursor, or Cursor.END once it has passed the smallest one.
+        """
+
+        if self.__modifications() != self.__expected:
+            raise ConcurrentModification('tree was modified outside this cursor')
+        stack = self.__stack
+        if not stack:
+            return self.__stack[-1].value if 0 < self.__side and self.last() else END
+        if not self.__reverse:
+            self.__turn()
+            stack = self.__stack
+        child = stack.pop().left
+        while child: # same walk as __step, inlined on the hot path
+            stack.append(child)
+            child = child.right
+        if self.__lazy or not stack:
+            self.__skip_tombstones(True)
+            if not stack:
+                return END
+        return stack[-1].value
+
+    @property
+    def value(self) -> Any:
+        """
+        The value under the cursor.
+        """
+
+        if self.__modifications() != self.__expected:
+            raise ConcurrentModification('tree was modified outside this cursor')
+        if not self.__stack:
+            raise IndexError('cursor is not positioned on a value')
+        return self.__stack[-1].value
+
+    @property
+    def count(self) -> int:
+        """
+        Number of duplicates of the value under the cursor.
+        """
+
+        if self.__modifications() != self.__expected:
+            raise ConcurrentModification('tree was modified outside this cursor')
+        if not self.__stack:
+            raise IndexError('cursor is not positioned on a value')
+        return self.__stack[-1].count
+
+    def delete_here(self):
+        """
+        Deletes one occurrence of the value under the cursor through the tree.
+        The cursor stays on the value while duplicates remain, and otherwise
+        moves to the next larger value. Costs O(log n), since deletion can rotate the path.
+        """
+
+        value = self.value
+        self.__tree.delete(value)
+        self.seek(value)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Yields the values from the current position upwards, advancing the cursor.
+        """
+
+        modifications = self.__modifications
+        modifications = self.__modifications
+        value = self.__stack[-1].value if self.valid() else END
+        while value is not END:
+            yield value
+            stack = self.__stack
+            if self.__reverse or self.__lazy or not stack:
+                value = self.next_value()
+                continue
+            if modifications() != self.__expected:
+                raise ConcurrentModification('tree was modified outside this cursor')
+            child = stack.pop().right
+            while child: # same walk as next_value, inlined for iteration
+                stack.append(child)
+                child = child.left
+            if not stack:
+                self.__side = 1
+                return
+            value = stack[-1].value
\ No newline at end of file
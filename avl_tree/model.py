@@ -1,5 +1,6 @@
-from typing import Any
+from typing import Any, Iterator
 from .node import Node
+from .cursor import Cursor
 from .exception import Empty
 
 
@@ -14,14 +15,28 @@ class AVLTree:
     __size : int
         Total number of elements in the tree (including duplicates).
     __node_count : int
-        Total number of nodes in the tree (excluding duplicates).
+        Total number of nodes in the tree (excluding duplicates and tombstones).
+    __lazy_delete : bool
+        If True, delete() marks nodes as tombstones (count 0) instead of unlinking them.
+    __compact_ratio : float
+        Fraction of tombstones among all nodes above which the tree is compacted.
+    __tombstones : int
+        Number of tombstone nodes currently in the tree.
+    __modifications : int
+        Number of mutating calls so far; cursors use it to detect concurrent modification.
     """
 
-    def __init__(self):
+    def __init__(self, *, lazy_delete: bool = False, compact_ratio: float = 0.5):
 
+        if not 0 < compact_ratio <= 1:
+            raise ValueError('compact_ratio must be in (0, 1]')
         self.root = None
         self.__size = 0
         self.__node_count = 0
+        self.__lazy_delete = lazy_delete
+        self.__compact_ratio = compact_ratio
+        self.__tombstones = 0
+        self.__modifications = 0
 
     def node_count(self) -> int:
         """
@@ -49,6 +64,55 @@ class AVLTree:
 
         return self.__size
 
+    def tombstones(self) -> int:
+        """
+        Returns the number of tombstone nodes waiting for compaction.
+
+        Returns
+        -------
+        int
+            Number of lazily deleted nodes still linked into the tree.
+        """
+
+        return self.__tombstones
+
+    def modifications(self) -> int:
+        """
+        Returns the number of mutating calls (insert, delete, pop, compact) made so far.
+
+        Returns
+        -------
+        int
+            Counter that changes whenever cursors over the tree become invalid.
+        """
+
+        return self.__modifications
+
+    def cursor(self, seek: Any = None) -> Cursor:
+        """
+        Returns a bidirectional cursor positioned on the smallest value >= `seek`,
+        or on the minimum when `seek` is None.
+
+        Returns
+        -------
+        Cursor
+            Cursor with next(), prev(), value, count and delete_here().
+        """
+
+        return Cursor(self, seek)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over the distinct values in sorted order through a cursor.
+        Raises ConcurrentModification if the tree changes during iteration.
+        """
+
+        return iter(Cursor(self))
+
+    def __contains__(self, value: Any, /) -> bool:
+
+        return self.search(value) is not None
+
     def __autoinc_size_node_count(self, autoinc_node: bool = False, /):
         """
         Increments the tree's size and optionally node count when a new element is added.
@@ -93,10 +157,19 @@ class AVLTree:
         After insertion, checks balance and performs rotations if necessary.
         """
 
-        if self.__node_count == 0:
+        self.__modifications += 1
+        if self.root is None:
             self.root = Node(value)
             self.__autoinc_size_node_count(True)
             return
+        if self.__tombstones:
+            node = self.__find(value)
+            if node is not None and node.count == 0: # revive a tombstone in place
+                node.count = 1
+                self.__tombstones -= 1
+                self.__autoinc_size_node_count(True)
+                self.__adjust_live(value, 1)
+                return
         self.root = self.__insert_helper(self.root, value)
 
     def __insert_helper(self, node: Node, value: Any, /) -> Node:
@@ -137,18 +210,93 @@ class AVLTree:
                 return self.__rotate_right(node)
             else: # left-right
                 return self.__rotate_lr(node)
-        node.height = self.get_height(node)
+        self.__update(node)
         return node
 
     def delete(self, value: Any, /):
         """
         Deletes a value from the AVL tree.
-        Currently not implemented.
+        Decreases the count if duplicates exist and rebalances after removal.
+        In lazy-delete mode the last occurrence only turns the node into a tombstone;
+        the tree is compacted once tombstones exceed `compact_ratio` of all nodes.
         """
 
         self.is_empty()
+        self.__modifications += 1
+        if self.__lazy_delete:
+            node = self.search(value)
+            if node is not None:
+                self.__bury(node)
+            return
         self.root = self.__delete_helper(self.root, value)
 
+    def __bury(self, node: Node, /):
+        """
+        Removes one occurrence from a live node in lazy-delete mode,
+        turning it into a tombstone when it was the last one.
+        """
+
+        node.count -= 1
+        if node.count > 0:
+            self.__autodec_size_node_count()
+            return
+        self.__autodec_size_node_count(True)
+        self.__tombstones += 1
+        self.__adjust_live(node.value, -1)
+        if self.__tombstones > self.__compact_ratio * (self.__node_count + self.__tombstones):
+            self.compact()
+
+    def __adjust_live(self, value: Any, delta: int, /):
+        """
+        Adds `delta` to the live-node count of every node on the path to `value`,
+        after the node holding it was buried or revived in place.
+        """
+
+        current = self.root
+        while current:
+            current.live += delta
+            if value < current.value:
+                current = current.left
+            elif current.value < value:
+                current = current.right
+            else:
+                return
+
+    def compact(self):
+        """
+        Drops every tombstone by rebuilding the tree from its live nodes
+        into a perfectly balanced AVL tree in linear time.
+        """
+
+        self.__modifications += 1
+        nodes = []
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            if current.count:
+                nodes.append(current)
+            current = current.right
+        self.root = self.__build(nodes, 0, len(nodes))
+        self.__tombstones = 0
+
+    def __build(self, nodes: list, lo: int, hi: int, /) -> Node | None:
+        """
+        Recursive helper for compact(). Links nodes[lo:hi] into a balanced subtree.
+        """
+
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.left = self.__build(nodes, lo, mid)
+        node.right = self.__build(nodes, mid + 1, hi)
+        self.__update(node)
+        return node
+
     def __delete_helper(self, node: Node, value: Any, /) -> Node:
 
         if node is None:
@@ -178,20 +326,97 @@ class AVLTree:
                 else:
                     self.__autodec_size_node_count(True)
                     return None
+        return self.__rebalance(node)
+
+    def __rebalance(self, node: Node, /) -> Node:
+        """
+        Restores the AVL property at a node after a removal below it.
+        The rotation case is chosen from the balance factor of the taller child.
+
+        Returns
+        -------
+        Node
+            The updated node (may be the new root after rotation).
+        """
+
         bf = self.get_balance(node)
         if bf < -1:
-            if node.right.value < value: # right-right
+            if self.get_balance(node.right) <= 0: # right-right
                 return self.__rotate_left(node)
             else: # right-left
                 return self.__rotate_rl(node)
         elif 1 < bf:
-            if value < node.left.value: # left-left
+            if 0 <= self.get_balance(node.left): # left-left
                 return self.__rotate_right(node)
             else: # left-right
                 return self.__rotate_lr(node)
-        node.height = self.get_height(node)
+        self.__update(node)
         return node
 
+    def pop_min(self) -> Any:
+        """
+        Removes one occurrence of the minimum value and returns it.
+        Finds and removes it in a single descent along the left spine.
+
+        Returns
+        -------
+        Any
+            The removed minimum value.
+        """
+
+        self.is_empty()
+        self.__modifications += 1
+        if self.__lazy_delete:
+            node = self.__first_live(self.root, False)
+            self.__bury(node)
+            return node.value
+        self.root, value = self.__pop_min_helper(self.root)
+        return value
+
+    def __pop_min_helper(self, node: Node, /) -> tuple:
+
+        if node.left is None:
+            if node.count > 1:
+                node.count -= 1
+                self.__autodec_size_node_count()
+                return node, node.value
+            self.__autodec_size_node_count(True)
+            return node.right, node.value
+        node.left, value = self.__pop_min_helper(node.left)
+        return self.__rebalance(node), value
+
+    def pop_max(self) -> Any:
+        """
+        Removes one occurrence of the maximum value and returns it.
+        Finds and removes it in a single descent along the right spine.
+
+        Returns
+        -------
+        Any
+            The removed maximum value.
+        """
+
+        self.is_empty()
+        self.__modifications += 1
+        if self.__lazy_delete:
+            node = self.__first_live(self.root, True)
+            self.__bury(node)
+            return node.value
+        self.root, value = self.__pop_max_helper(self.root)
+        return value
+
+    def __pop_max_helper(self, node: Node, /) -> tuple:
+
+        if node.right is None:
+            if node.count > 1:
+                node.count -= 1
+                self.__autodec_size_node_count()
+                return node, node.value
+            self.__autodec_size_node_count(True)
+            return node.left, node.value
+        node.right, value = self.__pop_max_helper(node.right)
+        return self.__rebalance(node), value
+
     def __successor(self, node: Node, /) -> Node:
 
         current = node
@@ -209,7 +434,16 @@ class AVLTree:
             Returns the node containing the value, or None if not found.
         """
 
-        self.is_balanced()
+        current = self.__find(value)
+        if current is not None and current.count == 0:
+            return None
+        return current
+
+    def __find(self, value: Any, /) -> Node | None:
+        """
+        Returns the node holding `value`, tombstones included, or None.
+        """
+
         current = self.root
         while current:
             if value < current.value:
@@ -220,6 +454,32 @@ class AVLTree:
                 break
         return current
 
+    def __first_live(self, node: Node, reverse: bool, /) -> Node | None:
+        """
+        Returns the smallest (or, with reverse, the largest) non-tombstone node of a subtree.
+        Walks the spine directly when there are no tombstones; otherwise
+        descends in O(log n), skipping subtrees whose live-node count is 0.
+        """
+
+        if self.__tombstones == 0:
+            if reverse:
+                while node.right:
+                    node = node.right
+            else:
+                while node.left:
+                    node = node.left
+            return node
+        if node.live == 0:
+            return None
+        while True:
+            near, far = (node.right, node.left) if reverse else (node.left, node.right)
+            if near and near.live:
+                node = near
+            elif node.count:
+                return node
+            else:
+                node = far
+
     def __rotate_lr(self, x: Node, /) -> Node:
         """
         Performs a Left-Right (LR) rotation.
@@ -247,8 +507,8 @@ class AVLTree:
         T2 = y.left
         y.left = x
         x.right = T2
-        x.height = self.get_height(x)
-        y.height = self.get_height(y)
+        self.__update(x)
+        self.__update(y)
         return y
 
     def __rotate_rl(self, x: Node) -> Node:
@@ -278,10 +538,19 @@ class AVLTree:
         T3 = y.right
         y.right = x
         x.left = T3
-        x.height = self.get_height(x)
-        y.height = self.get_height(y)
+        self.__update(x)
+        self.__update(y)
         return y
 
+    def __update(self, node: Node, /):
+        """
+        Recomputes the height and live-node count of a node from its children.
+        """
+
+        left, right = node.left, node.right
+        node.height = 1 + max(self.__node_height(left), self.__node_height(right))
+        node.live = (1 if node.count else 0) + (left.live if left else 0) + (right.live if right else 0)
+
     def get_height(self, node: Node, /) -> int:
         """
         Calculates the height of a node.
@@ -361,10 +630,7 @@ class AVLTree:
         """
 
         self.is_empty()
-        current = self.root
-        while current.left:
-            current = current.left
-        return current.value
+        return self.__first_live(self.root, False).value
 
     def max(self):
         """
@@ -377,10 +643,7 @@ class AVLTree:
         """
 
         self.is_empty()
-        current = self.root
-        while current.right:
-            current = current.right
-        return current.value
+        return self.__first_live(self.root, True).value
 
     def in_order(self) -> list:
         """
@@ -396,7 +659,8 @@ class AVLTree:
         if node is None:
             return
         self.__in_order_helper(node.left, arr)
-        arr.append(node.value)
+        if node.count:
+            arr.append(node.value)
         self.__in_order_helper(node.right, arr)
 
     def pre_order(self) -> list:
@@ -412,7 +676,8 @@ class AVLTree:
 
         if node is None:
             return
-        arr.append(node.value)
+        if node.count:
+            arr.append(node.value)
         self.__pre_order_helper(node.left, arr)
         self.__pre_order_helper(node.right, arr)
 
@@ -430,4 +695,5 @@ class AVLTree:
             return
         self.__post_order_helper(node.left, arr)
         self.__post_order_helper(node.right, arr)
-        arr.append(node.value)
\ No newline at end of file
+        if node.count:
+            arr.append(node.value)
\ No newline at end of file
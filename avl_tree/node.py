@@ -6,4 +6,5 @@ class Node:
         self.left = None
         self.right = None
         self.height = 1
-        self.count = 1
\ No newline at end of file
+        self.count = 1
+        self.live = 1
\ No newline at end of file
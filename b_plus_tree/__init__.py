@@ -0,0 +1 @@
+from .model import BPlusTree
\ No newline at end of file
@@ -0,0 +1,374 @@
+from bisect import bisect_left, bisect_right
+from typing import Any
+from .node import LeafNode, InternalNode
+from .exception import Empty
+
+
+class BPlusTree:
+    """
+    In-memory B+ Tree class.
+
+    Values live only in the leaves, which hold sorted Python lists searched
+    with `bisect`, so one node visit covers up to `order` keys instead of one.
+    Leaves are doubly linked, which makes in-order and range scans a walk
+    along the leaf chain.
+
+    Attributes
+    ----------
+    root : LeafNode | InternalNode
+        Root node of the tree (an empty leaf when the tree is empty).
+    __order : int
+        Maximum number of keys in a leaf and of children in an internal node.
+    __head : LeafNode
+        Leftmost leaf, the start of the leaf chain.
+    __size : int
+        Total number of elements in the tree (including duplicates).
+    __node_count : int
+        Total number of distinct values in the tree (excluding duplicates).
+    """
+
+    def __init__(self, order: int = 64, /):
+
+        if order < 3:
+            raise ValueError('BPlusTree order must be at least 3')
+        self.__order = order
+        self.root = LeafNode()
+        self.__head = self.root
+        self.__size = 0
+        self.__node_count = 0
+
+    def order(self) -> int:
+        """
+        Returns the fanout of the tree.
+        """
+
+        return self.__order
+
+    def node_count(self) -> int:
+        """
+        Returns the total number of distinct values in the tree,
+        excluding duplicates.
+
+        Returns
+        -------
+        int
+            Number of unique values in the tree.
+        """
+
+        return self.__node_count
+
+    def size(self) -> int:
+        """
+        Returns the total number of elements in the tree,
+        including duplicates.
+
+        Returns
+        -------
+        int
+            Total count of elements stored in the tree.
+        """
+
+        return self.__size
+
+    def is_empty(self):
+        """
+        Checks if the tree is empty.
+        Raises an Empty exception if the tree has no values.
+        """
+
+        if self.__node_count == 0:
+            raise Empty('BPlusTree is empty')
+
+    def height(self) -> int:
+        """
+        Returns the number of levels in the tree (1 for a single leaf).
+        """
+
+        h = 1
+        node = self.root
+        while isinstance(node, InternalNode):
+            node = node.children[0]
+            h += 1
+        return h
+
+    def insert(self, value: Any, /):
+        """
+        Inserts a new value into the tree.
+        If the value already exists, increments its count.
+        Full nodes are split on the way back up; a split root grows the tree by one level.
+        """
+
+        split = self.__insert_helper(self.root, value)
+        if split:
+            separator, right = split
+            root = InternalNode()
+            root.keys.append(separator)
+            root.children.extend((self.root, right))
+            self.root = root
+
+    def __insert_helper(self, node: LeafNode | InternalNode, value: Any, /) -> tuple | None:
+        """
+        Helper function for insertion. Works recursively.
+
+        Returns
+        -------
+        tuple | None
+            (separator, new right sibling) if the node was split, otherwise None.
+        """
+
+        if isinstance(node, LeafNode):
+            i = bisect_left(node.keys, value)
+            if i < len(node.keys) and node.keys[i] == value:
+                node.counts[i] += 1
+                self.__size += 1
+                return None
+            node.keys.insert(i, value)
+            node.counts.insert(i, 1)
+            self.__size += 1
+            self.__node_count += 1
+            if len(node.keys) > self.__order:
+                return self.__split_leaf(node)
+            return None
+        i = bisect_right(node.keys, value)
+        split = self.__insert_helper(node.children[i], value)
+        if split is None:
+            return None
+        separator, right = split
+        node.keys.insert(i, separator)
+        node.children.insert(i + 1, right)
+        if len(node.children) > self.__order:
+            return self.__split_internal(node)
+        return None
+
+    def __split_leaf(self, node: LeafNode, /) -> tuple:
+        """
+        Moves the upper half of a leaf into a new right sibling and links it into the leaf chain.
+        """
+
+        mid = len(node.keys) // 2
+        right = LeafNode()
+        right.keys = node.keys[mid:]
+        right.counts = node.counts[mid:]
+        del node.keys[mid:]
+        del node.counts[mid:]
+        right.next = node.next
+        right.prev = node
+        if node.next:
+            node.next.prev = right
+        node.next = right
+        return right.keys[0], right
+
+    def __split_internal(self, node: InternalNode, /) -> tuple:
+        """
+        Moves the upper half of an internal node into a new right sibling.
+        The middle key is pushed up to the parent.
+        """
+
+        mid = len(node.keys) // 2
+        separator = node.keys[mid]
+        right = InternalNode()
+        right.keys = node.keys[mid + 1:]
+        right.children = node.children[mid + 1:]
+        del node.keys[mid:]
+        del node.children[mid + 1:]
+        return separator, right
+
+    def delete(self, value: Any, /):
+        """
+        Deletes a value from the tree.
+        Decreases the count if duplicates exist, otherwise removes the key
+        and borrows from or merges with a sibling when a node underflows.
+        """
+
+        self.is_empty()
+        self.__delete_helper(self.root, value)
+        if isinstance(self.root, InternalNode) and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+
+    def __delete_helper(self, node: LeafNode | InternalNode, value: Any, /):
+
+        if isinstance(node, LeafNode):
+            i = bisect_left(node.keys, value)
+            if i == len(node.keys) or node.keys[i] != value:
+                return
+            self.__size -= 1
+            if node.counts[i] > 1:
+                node.counts[i] -= 1
+                return
+            del node.keys[i]
+            del node.counts[i]
+            self.__node_count -= 1
+            return
+        i = bisect_right(node.keys, value)
+        child = node.children[i]
+        self.__delete_helper(child, value)
+        if self.__is_underfull(child):
+            self.__rebalance(node, i)
+
+    def __is_underfull(self, node: LeafNode | InternalNode, /) -> bool:
+
+        if isinstance(node, LeafNode):
+            return len(node.keys) < self.__order // 2
+        return len(node.children) < (self.__order + 1) // 2
+
+    def __can_lend(self, node: LeafNode | InternalNode, /) -> bool:
+
+        if isinstance(node, LeafNode):
+            return len(node.keys) > self.__order // 2
+        return len(node.children) > (self.__order + 1) // 2
+
+    def __rebalance(self, parent: InternalNode, i: int, /):
+        """
+        Fixes an underfull child at index `i` by borrowing from a sibling,
+        or by merging it with one when neither sibling can lend.
+        """
+
+        child = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+        if isinstance(child, LeafNode):
+            if left and self.__can_lend(left):
+                child.keys.insert(0, left.keys.pop())
+                child.counts.insert(0, left.counts.pop())
+                parent.keys[i - 1] = child.keys[0]
+            elif right and self.__can_lend(right):
+                child.keys.append(right.keys.pop(0))
+                child.counts.append(right.counts.pop(0))
+                parent.keys[i] = right.keys[0]
+            elif left:
+                self.__merge_leaves(left, child)
+                del parent.keys[i - 1]
+                del parent.children[i]
+            else:
+                self.__merge_leaves(child, right)
+                del parent.keys[i]
+                del parent.children[i + 1]
+            return
+        if left and self.__can_lend(left):
+            child.keys.insert(0, parent.keys[i - 1])
+            child.children.insert(0, left.children.pop())
+            parent.keys[i - 1] = left.keys.pop()
+        elif right and self.__can_lend(right):
+            child.keys.append(parent.keys[i])
+            child.children.append(right.children.pop(0))
+            parent.keys[i] = right.keys.pop(0)
+        elif left:
+            left.keys.append(parent.keys[i - 1])
+            left.keys.extend(child.keys)
+            left.children.extend(child.children)
+            del parent.keys[i - 1]
+            del parent.children[i]
+        else:
+            child.keys.append(parent.keys[i])
+            child.keys.extend(right.keys)
+            child.children.extend(right.children)
+            del parent.keys[i]
+            del parent.children[i + 1]
+
+    def __merge_leaves(self, left: LeafNode, right: LeafNode, /):
+        """
+        Appends `right` to `left` and unlinks `right` from the leaf chain.
+        """
+
+        left.keys.extend(right.keys)
+        left.counts.extend(right.counts)
+        left.next = right.next
+        if right.next:
+            right.next.prev = left
+
+    def __find_leaf(self, value: Any, /) -> LeafNode:
+
+        node = self.root
+        while isinstance(node, InternalNode):
+            node = node.children[bisect_right(node.keys, value)]
+        return node
+
+    def search(self, value: Any, /) -> LeafNode | None:
+        """
+        Searches for a value in the tree.
+
+        Returns
+        -------
+        LeafNode | None
+            Returns the leaf holding the value, or None if not found.
+        """
+
+        leaf = self.__find_leaf(value)
+        i = bisect_left(leaf.keys, value)
+        if i < len(leaf.keys) and leaf.keys[i] == value:
+            return leaf
+        return None
+
+    def count(self, value: Any, /) -> int:
+        """
+        Returns the number of duplicates stored for a value (0 if absent).
+        """
+
+        leaf = self.__find_leaf(value)
+        i = bisect_left(leaf.keys, value)
+        if i < len(leaf.keys) and leaf.keys[i] == value:
+            return leaf.counts[i]
+        return 0
+
+    def __contains__(self, value: Any, /) -> bool:
+
+        return self.search(value) is not None
+
+    def min(self):
+        """
+        Returns the minimum value in the tree.
+
+        Returns
+        -------
+        Any
+            The minimum value.
+        """
+
+        self.is_empty()
+        return self.__head.keys[0]
+
+    def max(self):
+        """
+        Returns the maximum value in the tree.
+
+        Returns
+        -------
+        Any
+            The maximum value.
+        """
+
+        self.is_empty()
+        node = self.root
+        while isinstance(node, InternalNode):
+            node = node.children[-1]
+        return node.keys[-1]
+
+    def in_order(self) -> list:
+        """
+        Returns the distinct values of the tree in sorted order by walking the leaf chain.
+        """
+
+        arr = []
+        leaf = self.__head
+        while leaf:
+            arr.extend(leaf.keys)
+            leaf = leaf.next
+        return arr
+
+    def range(self, lo: Any, hi: Any, /) -> list:
+        """
+        Returns the distinct values `v` with `lo <= v <= hi` in sorted order.
+        Descends once to the leaf holding `lo`, then walks the leaf chain.
+        """
+
+        arr = []
+        leaf = self.__find_leaf(lo)
+        i = bisect_left(leaf.keys, lo)
+        while leaf:
+            j = bisect_right(leaf.keys, hi)
+            arr.extend(leaf.keys[i:j])
+            if j < len(leaf.keys):
+                break
+            leaf = leaf.next
+            i = 0
+        return arr
\ No newline at end of file
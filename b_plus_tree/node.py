@@ -0,0 +1,16 @@
+class LeafNode:
+
+    def __init__(self):
+
+        self.keys = []
+        self.counts = []
+        self.next = None
+        self.prev = None
+
+
+class InternalNode:
+
+    def __init__(self):
+
+        self.keys = []
+        self.children = []
\ No newline at end of file
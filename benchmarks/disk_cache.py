@@ -0,0 +1,73 @@
+"""
+Runs DiskBPlusTree with a page cache ten times smaller than the data file and
+reports lookup/range throughput, cache hit rate and page I/O.
+
+Run from the repository root:
+
+    python -m benchmarks.disk_cache --keys 500000 --ratio 10
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from disk_tree import DiskBPlusTree
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keys', type=int, default=500_000)
+    parser.add_argument('--probes', type=int, default=200_000)
+    parser.add_argument('--order', type=int, default=64)
+    parser.add_argument('--page-size', type=int, default=4096)
+    parser.add_argument('--ratio', type=int, default=10, help='data file size / cache size')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = list(range(args.keys))
+    rng.shuffle(values)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tree.db')
+        start = time.perf_counter()
+        with DiskBPlusTree(path, order=args.order, page_size=args.page_size, cache_bytes=1 << 30) as tree:
+            for value in values:
+                tree.insert(value)
+        built = time.perf_counter() - start
+        file_size = os.path.getsize(path)
+        cache_bytes = file_size // args.ratio
+        print(f'built {args.keys:,} keys in {built:.1f} s, file {file_size / 2**20:.1f} MiB, '
+              f'cache {cache_bytes / 2**20:.1f} MiB')
+
+        with DiskBPlusTree(path, order=args.order, page_size=args.page_size, cache_bytes=cache_bytes) as tree:
+            probes = [rng.randrange(args.keys) for _ in range(args.probes)]
+            start = time.perf_counter()
+            for value in probes:
+                tree.count(value)
+            elapsed = time.perf_counter() - start
+            stats = tree.stats()
+            print(f'point lookups {args.probes / elapsed:>10,.0f} op/s   hit rate {stats["hit_rate"]:.1%}   '
+                  f'page reads {stats["reads"]:,}')
+
+            before = tree.stats()['reads']
+            start = time.perf_counter()
+            scanned = 0
+            for _ in range(1000):
+                lo = rng.randrange(args.keys)
+                scanned += len(tree.range(lo, lo + 1000))
+            elapsed = time.perf_counter() - start
+            print(f'range scans   {scanned / elapsed:>10,.0f} keys/s   page reads {tree.stats()["reads"] - before:,}')
+
+            start = time.perf_counter()
+            for value in probes[:args.probes // 4]:
+                tree.insert(value + 0.5)
+            elapsed = time.perf_counter() - start
+            stats = tree.stats()
+            print(f'inserts       {args.probes // 4 / elapsed:>10,.0f} op/s   page writes {stats["writes"]:,}')
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
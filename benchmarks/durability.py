@@ -0,0 +1,66 @@
+"""
+Measures DurableTree write latency with group commit on and off, plus
+snapshot compaction and recovery time.
+
+Run from the repository root:
+
+    python -m benchmarks.durability --writes 20000 --commit-every 64
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+from avl_tree import AVLTree
+from durable_tree import DurableTree
+
+
+def write_latencies(directory: str, values: list, group_commit: bool, commit_every: int, /) -> list:
+
+    latencies = []
+    with DurableTree(directory, factory=AVLTree, group_commit=group_commit, commit_every=commit_every) as tree:
+        for value in values:
+            start = time.perf_counter()
+            tree.insert(value)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--writes', type=int, default=20_000)
+    parser.add_argument('--commit-every', type=int, default=64)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = [rng.randrange(args.writes * 10) for _ in range(args.writes)]
+    print(f'{"group commit":>14} {"writes":>14} {"p50":>10} {"p99":>10} {"max":>10}')
+    for group_commit in (False, True):
+        with tempfile.TemporaryDirectory() as directory:
+            latencies = write_latencies(directory, values, group_commit, args.commit_every)
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(f'{"on" if group_commit else "off":>14} '
+                  f'{len(latencies) / sum(latencies):>9,.0f} op/s '
+                  f'{quantiles[49] * 1e6:>7.1f} us {quantiles[98] * 1e6:>7.1f} us '
+                  f'{max(latencies) * 1e6:>7.0f} us')
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_latencies(directory, values, True, args.commit_every)
+        start = time.perf_counter()
+        with DurableTree(directory) as tree:
+            replayed = time.perf_counter() - start
+            start = time.perf_counter()
+            tree.compact(True)
+            compacted = time.perf_counter() - start
+        start = time.perf_counter()
+        DurableTree(directory).close()
+        restored = time.perf_counter() - start
+        print(f'journal replay {replayed * 1e3:.0f} ms, compaction {compacted * 1e3:.0f} ms, '
+              f'snapshot restore {restored * 1e3:.0f} ms')
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+Measures eviction cost under a steady stream of inserts: manual min()+delete()
+trimming of an AVLTree against BoundedTree's single-descent eviction and TTL expiry.
+
+Run from the repository root:
+
+    python -m benchmarks.eviction --inserts 300000 --capacity 10000
+"""
+import argparse
+import random
+import time
+
+from avl_tree import AVLTree
+from bounded_tree import BoundedTree
+
+
+class TickClock:
+    """
+    Deterministic clock advanced by one unit per insert.
+    """
+
+    def __init__(self):
+
+        self.now = 0.0
+
+    def __call__(self) -> float:
+
+        return self.now
+
+
+def manual_trim(stream: list, capacity: int, /) -> float:
+
+    tree = AVLTree()
+    start = time.perf_counter()
+    for value in stream:
+        tree.insert(value)
+        if tree.size() > capacity:
+            tree.delete(tree.min())
+    return time.perf_counter() - start
+
+
+def bounded(stream: list, capacity: int, /) -> float:
+
+    tree = BoundedTree(capacity, evict='min')
+    start = time.perf_counter()
+    for value in stream:
+        tree.insert(value)
+    return time.perf_counter() - start
+
+
+def expiring(stream: list, capacity: int, /) -> float:
+
+    clock = TickClock()
+    tree = BoundedTree(ttl=float(capacity), clock=clock)
+    start = time.perf_counter()
+    for value in stream:
+        clock.now += 1
+        tree.insert(value)
+    return time.perf_counter() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--inserts', type=int, default=300_000)
+    parser.add_argument('--capacity', type=int, default=10_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # mostly increasing, like event timestamps with some jitter
+    stream = [i + rng.randrange(100) for i in range(args.inserts)]
+    runs = (
+        ('AVLTree min()+delete()', manual_trim),
+        ('BoundedTree max_size', bounded),
+        ('BoundedTree ttl', expiring),
+    )
+    print(f'{"strategy":>24} {"inserts":>16}')
+    for name, run in runs:
+        elapsed = run(stream, args.capacity)
+        print(f'{name:>24} {args.inserts / elapsed:>11,.0f} op/s')
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
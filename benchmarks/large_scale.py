@@ -0,0 +1,66 @@
+"""
+Compares lookup throughput and memory of BPlusTree against AVLTree at 10^6+ keys.
+
+Run from the repository root:
+
+    python -m benchmarks.large_scale --keys 1000000 --order 64
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from avl_tree import AVLTree
+from b_plus_tree import BPlusTree
+
+
+def build(factory, values: list, /) -> tuple:
+    """
+    Builds a tree under tracemalloc and returns it with the bytes it holds.
+    """
+
+    tracemalloc.start()
+    tree = factory()
+    for value in values:
+        tree.insert(value)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tree, memory
+
+
+def lookups(tree, probes: list, /) -> float:
+
+    start = time.perf_counter()
+    for value in probes:
+        tree.search(value)
+    return len(probes) / (time.perf_counter() - start)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keys', type=int, default=1_000_000)
+    parser.add_argument('--probes', type=int, default=1_000_000)
+    parser.add_argument('--order', type=int, default=64)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = list(range(args.keys))
+    rng.shuffle(values)
+    probes = [rng.randrange(args.keys) for _ in range(args.probes)]
+
+    engines = (
+        ('AVLTree', AVLTree),
+        (f'BPlusTree({args.order})', lambda: BPlusTree(args.order)),
+    )
+    print(f'{"engine":>16} {"memory":>12} {"bytes/key":>10} {"lookups":>16}')
+    for name, factory in engines:
+        tree, memory = build(factory, values)
+        rate = lookups(tree, probes)
+        print(f'{name:>16} {memory / 2**20:>9.1f} MiB {memory / args.keys:>10.1f} {rate:>11,.0f} op/s')
+        del tree
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
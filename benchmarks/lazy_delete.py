@@ -0,0 +1,56 @@
+"""
+Compares eager and lazy (tombstone) deletion in AVLTree on burst delete /
+re-insert churn, including the read overhead of tombstones and compaction.
+
+Run from the repository root:
+
+    python -m benchmarks.lazy_delete --keys 200000 --burst 0.4
+"""
+import argparse
+import random
+import time
+
+from avl_tree import AVLTree
+
+
+def timed(operation, values: list, /) -> float:
+
+    start = time.perf_counter()
+    for value in values:
+        operation(value)
+    return len(values) / (time.perf_counter() - start)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keys', type=int, default=200_000)
+    parser.add_argument('--burst', type=float, default=0.4, help='fraction of keys deleted per burst')
+    parser.add_argument('--probes', type=int, default=200_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = list(range(args.keys))
+    rng.shuffle(values)
+    burst = values[:int(args.keys * args.burst)]
+    probes = [rng.randrange(args.keys) for _ in range(args.probes)]
+
+    print(f'{"mode":>6} {"deletes":>16} {"searches":>16} {"re-inserts":>16} {"compact":>10}')
+    for lazy in (False, True):
+        tree = AVLTree(lazy_delete=lazy)
+        for value in values:
+            tree.insert(value)
+        deletes = timed(tree.delete, burst)
+        searches = timed(tree.search, probes)
+        reinserts = timed(tree.insert, burst)
+        timed(tree.delete, burst)
+        start = time.perf_counter()
+        tree.compact()
+        compact = time.perf_counter() - start
+        print(f'{"lazy" if lazy else "eager":>6} {deletes:>11,.0f} op/s {searches:>11,.0f} op/s '
+              f'{reinserts:>11,.0f} op/s {compact * 1e3:>7.0f} ms')
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
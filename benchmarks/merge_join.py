@@ -0,0 +1,95 @@
+"""
+Intersects two trees with a cursor merge-join and with one search per value,
+and walks a whole tree with a cursor versus in_order().
+
+Run from the repository root:
+
+    python -m benchmarks.merge_join --keys 200000 --overlap 0.5
+"""
+import argparse
+import random
+import time
+
+from avl_tree import AVLTree
+from binary_search_tree import BinarySearchTree
+
+
+def search_join(left, right, /) -> int:
+
+    matches = 0
+    for value in left.in_order():
+        if right.search(value) is not None:
+            matches += 1
+    return matches
+
+
+def cursor_join(left, right, /) -> int:
+
+    matches = 0
+    a, b = left.cursor(), right.cursor()
+    if not (a.valid() and b.valid()):
+        return matches
+    a_end, b_end = a.END, b.END
+    next_a, next_b = a.next_value, b.next_value
+    x, y = a.value, b.value
+    while True:
+        if x < y:
+            x = next_a()
+            if x is a_end:
+                break
+        elif y < x:
+            y = next_b()
+            if y is b_end:
+                break
+        else:
+            matches += 1
+            x, y = next_a(), next_b()
+            if x is a_end or y is b_end:
+                break
+    return matches
+
+
+def cursor_walk(tree, /) -> int:
+
+    return sum(1 for _ in tree)
+
+
+def timed(function, *args) -> tuple:
+
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keys', type=int, default=200_000)
+    parser.add_argument('--overlap', type=float, default=0.5, help='fraction of keys shared by both trees')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    shift = int(args.keys * (1 - args.overlap))
+    left_values = list(range(args.keys))
+    right_values = list(range(shift, shift + args.keys))
+    rng.shuffle(left_values)
+    rng.shuffle(right_values)
+
+    print(f'{"tree":>18} {"search join":>14} {"cursor join":>14} {"in_order":>12} {"cursor walk":>12}')
+    for name, factory in (('AVLTree', AVLTree), ('BinarySearchTree', lambda: BinarySearchTree(0.7))):
+        left, right = factory(), factory()
+        for value in left_values:
+            left.insert(value)
+        for value in right_values:
+            right.insert(value)
+        expected, searched = timed(search_join, left, right)
+        matches, joined = timed(cursor_join, left, right)
+        assert matches == expected
+        _, listed = timed(left.in_order)
+        _, walked = timed(cursor_walk, left)
+        print(f'{name:>18} {searched:>12.3f} s {joined:>12.3f} s {listed:>10.3f} s {walked:>10.3f} s')
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+Measures ShardedTree throughput for batched inserts, batched lookups and
+range scans as the number of worker processes grows.
+
+Run from the repository root:
+
+    python -m benchmarks.sharding --keys 200000 --shards 1 2 4
+
+Shards only run in parallel when the machine has spare cores; on a single
+core the numbers show the routing and IPC overhead instead of the scaling.
+"""
+import argparse
+import os
+import random
+import time
+
+from sharded_tree import ShardedTree
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keys', type=int, default=200_000)
+    parser.add_argument('--shards', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--batch', type=int, default=10_000)
+    parser.add_argument('--probes', type=int, default=200_000)
+    parser.add_argument('--scans', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = list(range(args.keys))
+    rng.shuffle(values)
+    probes = [rng.randrange(args.keys) for _ in range(args.probes)]
+    width = args.keys // 20
+    scans = [rng.randrange(args.keys - width) for _ in range(args.scans)]
+
+    print(f'{os.cpu_count()} CPU(s)')
+    print(f'{"shards":>6} {"inserts":>16} {"lookups":>16} {"range scans":>18}')
+    for shards in args.shards:
+        boundaries = [args.keys * i // shards for i in range(1, shards)]
+        with ShardedTree(shards, boundaries=boundaries) as tree:
+            start = time.perf_counter()
+            for i in range(0, args.keys, args.batch):
+                tree.insert_many(values[i:i + args.batch])
+            inserts = args.keys / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for i in range(0, args.probes, args.batch):
+                tree.count_many(probes[i:i + args.batch])
+            lookups = args.probes / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            scanned = 0
+            for lo in scans:
+                scanned += sum(1 for _ in tree.scan(lo, lo + width))
+            keys = scanned / (time.perf_counter() - start)
+        print(f'{shards:>6} {inserts:>10,.0f} op/s {lookups:>10,.0f} op/s {keys:>11,.0f} keys/s')
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Compares SplayTree and AVLTree lookups under Zipf-distributed probes.
+
+Run from the repository root:
+
+    python -m benchmarks.skewed_access --keys 100000 --probes 500000 --skew 1.1
+"""
+import argparse
+import itertools
+import random
+import time
+
+from avl_tree import AVLTree
+from splay_tree import SplayTree
+
+
+def zipf_probes(keys: list, probes: int, skew: float, rng: random.Random, /) -> list:
+    """
+    Draws probes where the key of rank r is hit with weight 1 / r**skew.
+    Ranks are assigned to keys at random so hot keys are spread over the key space.
+    """
+
+    hot = keys[:]
+    rng.shuffle(hot)
+    weights = list(itertools.accumulate(1 / rank ** skew for rank in range(1, len(hot) + 1)))
+    return rng.choices(hot, cum_weights=weights, k=probes)
+
+
+def lookups(tree, probes: list, /) -> float:
+
+    start = time.perf_counter()
+    for value in probes:
+        tree.search(value)
+    return len(probes) / (time.perf_counter() - start)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keys', type=int, default=100_000)
+    parser.add_argument('--probes', type=int, default=500_000)
+    parser.add_argument('--skew', type=float, nargs='+', default=[0.0, 0.8, 1.1, 1.5])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keys = list(range(args.keys))
+    order = keys[:]
+    rng.shuffle(order)
+    print(f'{"skew":>6} ' + ' '.join(f'{engine.__name__:>16}' for engine in (AVLTree, SplayTree)))
+    for skew in args.skew:
+        probes = zipf_probes(keys, args.probes, skew, rng)
+        rates = []
+        for engine in (AVLTree, SplayTree):
+            tree = engine()
+            for value in order:
+                tree.insert(value)
+            rates.append(lookups(tree, probes))
+        print(f'{skew:>6} ' + ' '.join(f'{rate:>11,.0f} op/s' for rate in rates))
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Measures rolling median / p99 throughput in events per second: SlidingWindow
+per event and per chunk, against an AVLTree window indexed through in_order().
+
+Run from the repository root:
+
+    python -m benchmarks.sliding_window --events 200000 --windows 1000 10000 100000
+
+Chunks are NumPy arrays when NumPy is installed, and array.array otherwise.
+"""
+import argparse
+import array
+import random
+import time
+from collections import deque
+
+from avl_tree import AVLTree
+from sliding_window import SlidingWindow
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def naive(warm: list, values: list, window: int, /) -> float:
+    """
+    Baseline: AVLTree of the window, median and p99 read by indexing in_order(), O(n) per tick.
+    """
+
+    tree = AVLTree()
+    queue = deque(warm)
+    for value in warm:
+        tree.insert(value)
+    start = time.perf_counter()
+    for value in values:
+        tree.insert(value)
+        queue.append(value)
+        if len(queue) > window:
+            tree.delete(queue.popleft())
+        ordered = tree.in_order()
+        ordered[len(ordered) // 2], ordered[int(0.99 * (len(ordered) - 1))]
+    return len(values) / (time.perf_counter() - start)
+
+
+def per_event(warm: list, values: list, window: int, /) -> float:
+
+    stats = SlidingWindow(window)
+    stats.extend(warm)
+    start = time.perf_counter()
+    for value in values:
+        stats.push(value)
+        stats.median(), stats.quantile(0.99)
+    return len(values) / (time.perf_counter() - start)
+
+
+def per_chunk(warm: list, values: list, window: int, chunk: int, /) -> float:
+
+    chunks = [values[i:i + chunk] for i in range(0, len(values), chunk)]
+    chunks = [numpy.array(part) if numpy else array.array('d', part) for part in chunks]
+    stats = SlidingWindow(window)
+    stats.extend(warm)
+    start = time.perf_counter()
+    for part in chunks:
+        stats.extend(part)
+        stats.median(), stats.quantile(0.99)
+    return len(values) / (time.perf_counter() - start)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--events', type=int, default=200_000)
+    parser.add_argument('--windows', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--chunk', type=int, default=1_000)
+    parser.add_argument('--naive-events', type=int, default=1_000, help='events for the O(n) baseline')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = [rng.lognormvariate(0, 1) for _ in range(args.events)]
+
+    print(f'{"window":>8} {"in_order baseline":>20} {"push + query":>16} {"chunk + query":>16}')
+    for window in args.windows:
+        warm = [rng.lognormvariate(0, 1) for _ in range(window)]
+        baseline = naive(warm, values[:args.naive_events], window)
+        event = per_event(warm, values, window)
+        chunked = per_chunk(warm, values, window, args.chunk)
+        print(f'{window:>8,} {baseline:>14,.0f} ev/s {event:>10,.0f} ev/s {chunked:>10,.0f} ev/s')
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Measures sorted (timestamp-like) ingest into BinarySearchTree with and without
+scapegoat balancing, against AVLTree.
+
+Run from the repository root:
+
+    python -m benchmarks.sorted_ingest --keys 200000 --alpha 0.7
+"""
+import argparse
+import random
+import time
+
+from avl_tree import AVLTree
+from binary_search_tree import BinarySearchTree
+
+
+def ingest(tree, keys: int, probes: list, /) -> tuple:
+    """
+    Inserts 0..keys-1 in ascending order, then searches the probes.
+    Returns (insert rate, search rate, height).
+    """
+
+    start = time.perf_counter()
+    for value in range(keys):
+        tree.insert(value)
+    inserted = time.perf_counter()
+    for value in probes:
+        tree.search(value)
+    searched = time.perf_counter()
+    height = tree.height() if isinstance(tree, BinarySearchTree) else tree.root.height - 1
+    return keys / (inserted - start), len(probes) / (searched - inserted), height
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keys', type=int, default=200_000)
+    parser.add_argument('--plain-keys', type=int, default=3_000,
+                        help='keys for the unbalanced BST, which degrades to a linked list')
+    parser.add_argument('--probes', type=int, default=100_000)
+    parser.add_argument('--alpha', type=float, default=0.7)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    runs = (
+        ('BinarySearchTree', BinarySearchTree, args.plain_keys),
+        (f'BinarySearchTree({args.alpha})', lambda: BinarySearchTree(args.alpha), args.keys),
+        ('AVLTree', AVLTree, args.keys),
+    )
+    print(f'{"engine":>22} {"keys":>9} {"inserts":>16} {"searches":>16} {"height":>7}')
+    for name, factory, keys in runs:
+        probes = [rng.randrange(keys) for _ in range(args.probes)]
+        insert_rate, search_rate, height = ingest(factory(), keys, probes)
+        print(f'{name:>22} {keys:>9,} {insert_rate:>11,.0f} op/s {search_rate:>11,.0f} op/s {height:>7}')
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Compares AVLTree, RedBlackTree and Treap under mixed read/write workloads.
+
+Run from the repository root:
+
+    python -m benchmarks.write_heavy --keys 100000 --ops 200000
+"""
+import argparse
+import random
+import time
+
+from avl_tree import AVLTree
+from red_black_tree import RedBlackTree
+from treap import Treap
+
+
+ENGINES = (AVLTree, RedBlackTree, Treap)
+WRITE_RATIOS = (0.1, 0.5, 0.9)
+
+
+def make_workload(keys: int, ops: int, write_ratio: float, seed: int, /) -> list:
+    """
+    Builds a list of (operation, value) pairs. Writes are split evenly
+    between inserts and deletes so the tree size stays roughly constant.
+    """
+
+    rng = random.Random(seed)
+    workload = []
+    for _ in range(ops):
+        value = rng.randrange(keys * 2)
+        if rng.random() < write_ratio:
+            workload.append(('insert' if rng.random() < 0.5 else 'delete', value))
+        else:
+            workload.append(('search', value))
+    return workload
+
+
+def run(engine, preload: list, workload: list, /) -> float:
+
+    tree = engine()
+    for value in preload:
+        tree.insert(value)
+    start = time.perf_counter()
+    for op, value in workload:
+        if op == 'insert':
+            tree.insert(value)
+        elif op == 'delete':
+            tree.delete(value)
+        else:
+            tree.search(value)
+    return time.perf_counter() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keys', type=int, default=100_000)
+    parser.add_argument('--ops', type=int, default=200_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    preload = [rng.randrange(args.keys * 2) for _ in range(args.keys)]
+    print(f'{"writes":>8} ' + ' '.join(f'{engine.__name__:>14}' for engine in ENGINES))
+    for ratio in WRITE_RATIOS:
+        workload = make_workload(args.keys, args.ops, ratio, args.seed)
+        timings = [run(engine, preload, workload) for engine in ENGINES]
+        row = ' '.join(f'{args.ops / t:>10,.0f} op/s' for t in timings)
+        print(f'{ratio:>8.0%} {row}')
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,213 @@
+from typing import Any, Iterator
+from .node import Node
+from .exception import ConcurrentModification
+
+
+END = object() # returned by next_value() and prev_value() once the cursor steps off an end
+
+
+class Cursor:
+    """Bidirectional cursor over a BinarySearchTree, stepping through a stack of the ancestors still ahead.
+
+    The current node sits on top of the ancestors the cursor will still visit in its direction
+    of travel, so a step pops it and pushes the spine of its next subtree: a full walk pushes and
+    pops every node once, O(1) amortized per step, O(height) for a single step. Changing direction
+    rebuilds the stack from the root in O(height). Any tree mutation invalidates the stack
+    (deletion copies successor values, scapegoat rebuilds relink whole subtrees), so the cursor
+    raises ConcurrentModification once the tree changed through anything but its own
+    delete_here(). A cursor that steps off either end becomes invalid; stepping back re-enters
+    at the nearest end. next_value() and prev_value() are the low-overhead stepping path: one
+    modification check per step, returning the new value or Cursor.END.
+
+    Attributes:
+        __tree (BinarySearchTree): The tree being walked.
+        __stack (list): Ancestors still ahead, then the current node; empty when the cursor is invalid.
+        __reverse (bool): Direction the stack is built for: False for next(), True for prev().
+        __side (int): End an invalid cursor fell off: -1 before the first value, 1 past the last.
+        __expected (int): Tree modification counter the stack is valid for.
+    """
+
+    END = END
+
+    def __init__(self, tree, seek: Any = None, /):
+
+        self.__tree = tree
+        self.__modifications = tree.modifications
+        self.__stack = []
+        self.__reverse = False
+        self.__side = 1
+        if seek is None:
+            self.first()
+        else:
+            self.seek(seek)
+
+    def __reset(self, reverse: bool, /) -> list:
+        """Start an empty stack for a direction and record the modification counter."""
+
+        self.__expected = self.__modifications()
+        self.__reverse = reverse
+        self.__stack = []
+        return self.__stack
+
+    def __descend(self, node: Node | None, reverse: bool, /):
+        """Push node and its leftmost (rightmost with reverse) spine."""
+
+        while node:
+            self.__stack.append(node)
+            node = node.right if reverse else node.left
+
+    def __turn(self):
+        """Rebuild the stack around the current node for the other direction."""
+
+        target = self.__stack[-1]
+        value = target.value
+        reverse = self.__reverse = not self.__reverse
+        stack = self.__stack = []
+        current = self.__tree.root
+        while current is not target:
+            if current.value < value:
+                if reverse:
+                    stack.append(current)
+                current = current.right
+            else:
+                if not reverse:
+                    stack.append(current)
+                current = current.left
+        stack.append(target)
+
+    def first(self) -> bool:
+        """Position the cursor on the smallest value. Returns True if the tree is not empty."""
+
+        self.__reset(False)
+        self.__descend(self.__tree.root, False)
+        return bool(self.__stack)
+
+    def last(self) -> bool:
+        """Position the cursor on the largest value. Returns True if the tree is not empty."""
+
+        self.__reset(True)
+        self.__descend(self.__tree.root, True)
+        return bool(self.__stack)
+
+    def seek(self, value: Any, /) -> bool:
+        """Position the cursor on the smallest value >= value. Returns False if every value is smaller."""
+
+        stack = self.__reset(False)
+        current = self.__tree.root
+        while current:
+            if current.value < value:
+                current = current.right
+            else:
+                stack.append(current)
+                if current.value == value:
+                    break
+                current = current.left
+        self.__side = 1
+        return bool(stack)
+
+    def valid(self) -> bool:
+        """Return True if the cursor is positioned on a value."""
+
+        if self.__modifications() != self.__expected:
+            raise ConcurrentModification('tree was modified outside this cursor')
+        return bool(self.__stack)
+
+    def next(self) -> bool:
+        """Move to the next larger value. Returns False once the cursor has passed the largest one."""
+
+        return self.next_value() is not END
+
+    def prev(self) -> bool:
+        """Move to the next smaller value. Returns False once the cursor has passed the smallest one."""
+
+        return self.prev_value() is not END
+
+    def next_value(self) -> Any:
+        """Move to the next larger value and return it (Cursor.END past the largest), with one modification check."""
+
+        if self.__modifications() != self.__expected:
+            raise ConcurrentModification('tree was modified outside this cursor')
+        stack = self.__stack
+        if not stack:
+            return self.__stack[-1].value if self.__side < 0 and self.first() else END
+        if self.__reverse:
+            self.__turn()
+            stack = self.__stack
+        child = stack.pop().right
+        while child:
+            stack.append(child)
+            child = child.left
+        if not stack:
+            self.__side = 1
+            return END
+        return stack[-1].value
+
+    def prev_value(self) -> Any:
+        """Move to the next smaller value and return it (Cursor.END past the smallest), with one modification check."""
+
+        if self.__modifications() != self.__expected:
+            raise ConcurrentModification('tree was modified outside this cursor')
+        stack = self.__stack
+        if not stack:
+            return self.__stack[-1].value if 0 < self.__side and self.last() else END
+        if not self.__reverse:
+            self.__turn()
+            stack = self.__stack
+        child = stack.pop().left
+        while child:
+            stack.append(child)
+            child = child.right
+        if not stack:
+            self.__side = -1
+            return END
+        return stack[-1].value
+
+    @property
+    def value(self) -> Any:
+        """The value under the cursor."""
+
+        if self.__modifications() != self.__expected:
+            raise ConcurrentModification('tree was modified outside this cursor')
+        if not self.__stack:
+            raise IndexError('cursor is not positioned on a value')
+        return self.__stack[-1].value
+
+    @property
+    def count(self) -> int:
+        """Number of duplicates of the value under the cursor."""
+
+        if self.__modifications() != self.__expected:
+            raise ConcurrentModification('tree was modified outside this cursor')
+        if not self.__stack:
+            raise IndexError('cursor is not positioned on a value')
+        return self.__stack[-1].count
+
+    def delete_here(self):
+        """Delete one occurrence of the current value; the cursor then moves on to the next larger value
+        once no duplicates remain. Re-seeks in O(height), since deletion may relink the path."""
+
+        value = self.value
+        self.__tree.delete(value)
+        self.seek(value)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the values from the current position upwards, advancing the cursor."""
+
+        modifications = self.__modifications
+        value = self.__stack[-1].value if self.valid() else END
+        while value is not END:
+            yield value
+            stack = self.__stack
+            if self.__reverse or not stack:
+                value = self.next_value()
+                continue
+            if modifications() != self.__expected:
+                raise ConcurrentModification('tree was modified outside this cursor')
+            child = stack.pop().right
+            while child: # same walk as next_value, inlined for iteration
+                stack.append(child)
+                child = child.left
+            if not stack:
+                self.__side = 1
+                return
+            value = stack[-1].value
\ No newline at end of file
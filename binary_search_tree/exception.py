@@ -1,2 +1,6 @@
 class Empty(Exception):
+    pass
+
+
+class ConcurrentModification(Exception):
     pass
\ No newline at end of file
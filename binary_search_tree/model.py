@@ -1,14 +1,26 @@
-from typing import Any
+import math
+from typing import Any, Iterator
 from .node import Node
+from .cursor import Cursor
 from .exception import Empty
 
 
 class BinarySearchTree:
     """Binary Search Tree (BST) implementation supporting duplicate elements via 'count'.
 
+    Passing `alpha` (0.5 < alpha < 1) enables scapegoat balancing: when an insert lands
+    deeper than log(max_size) / log(1 / alpha), the first alpha-unbalanced ancestor found
+    walking up from the new node (the deepest one) is rebuilt into a perfectly balanced
+    subtree in linear time, and the whole tree is rebuilt once deletions shrink it below
+    alpha * max_size. This keeps the height O(log n) with O(log n) amortized updates and
+    needs no extra field on Node.
+
     Attributes:
         root (Node | None): The root node of the BST.
         __size (int): Number of unique nodes in the tree.
+        __alpha (float | None): Scapegoat balance factor, or None for a plain BST.
+        __max_size (int): Largest size since the last full rebuild (scapegoat mode only).
+        __modifications (int): Number of insert/delete calls so far, used by cursors to detect concurrent modification.
 
     Methods:
         insert(value): Insert a value into the BST. Increments count if value exists.
@@ -19,14 +31,20 @@ class BinarySearchTree:
         in_order(): Return list of values in in-order traversal.
         pre_order(): Return list of values in pre-order traversal.
         post_order(): Return list of values in post-order traversal.
+        cursor(seek): Return a bidirectional Cursor positioned on the smallest value >= seek.
         height(): Return the height of the BST.
         is_empty(): Raise Empty exception if the BST is empty.
     """
 
-    def __init__(self):
+    def __init__(self, alpha: float | None = None, /):
 
+        if alpha is not None and not 0.5 < alpha < 1:
+            raise ValueError('alpha must be between 0.5 and 1')
         self.root = None
         self.__size = 0
+        self.__alpha = alpha
+        self.__max_size = 0
+        self.__modifications = 0
 
     def __autoinc_size(self):
 
@@ -41,6 +59,25 @@ class BinarySearchTree:
 
         return self.__size
 
+    def modifications(self) -> int:
+        """Return the number of insert/delete calls made so far; cursors become invalid when it changes."""
+
+        return self.__modifications
+
+    def cursor(self, seek: Any = None) -> Cursor:
+        """Return a bidirectional cursor on the smallest value >= seek (the minimum when seek is None)."""
+
+        return Cursor(self, seek)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the values in sorted order; raises ConcurrentModification if the tree changes meanwhile."""
+
+        return iter(Cursor(self))
+
+    def __contains__(self, value: Any, /) -> bool:
+
+        return self.__size > 0 and self.search(value) is not None
+
     def is_empty(self):
         """Raise Empty exception if the BST has no nodes."""
 
@@ -50,12 +87,16 @@ class BinarySearchTree:
     def insert(self, value: Any, /):
         """Insert a value into the BST."""
 
+        self.__modifications += 1
         if self.__size == 0:
             self.root = Node(value)
             self.__autoinc_size()
+            self.__max_size = max(self.__max_size, self.__size)
             return
+        path = []
         current = self.root
         while current:
+            path.append(current)
             if value == current.value:
                 break
             if value < current.value:
@@ -71,11 +112,75 @@ class BinarySearchTree:
         if current.value == value:
             current.count += 1
             return
+        node = Node(value)
         if value < current.value:
-            current.left = Node(value)
+            current.left = node
         if current.value < value:
-            current.right = Node(value)
+            current.right = node
         self.__autoinc_size()
+        if self.__alpha is not None:
+            self.__max_size = max(self.__max_size, self.__size)
+            if len(path) > math.log(self.__max_size, 1 / self.__alpha):
+                self.__rebuild_scapegoat(path, node)
+
+    def __rebuild_scapegoat(self, path: list, node: Node, /):
+        """Walk up the insertion path to the first alpha-unbalanced ancestor and rebuild it."""
+
+        child, child_size = node, 1
+        for i in range(len(path) - 1, -1, -1):
+            parent = path[i]
+            sibling = parent.right if parent.left is child else parent.left
+            parent_size = child_size + self.__subtree_size(sibling) + 1
+            if child_size > self.__alpha * parent_size:
+                subtree = self.__rebuild(parent, parent_size)
+                if i == 0:
+                    self.root = subtree
+                elif path[i - 1].left is parent:
+                    path[i - 1].left = subtree
+                else:
+                    path[i - 1].right = subtree
+                return
+            child, child_size = parent, parent_size
+
+    def __subtree_size(self, node: Node | None, /) -> int:
+        """Count the nodes of a subtree iteratively."""
+
+        total = 0
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            total += 1
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        return total
+
+    def __rebuild(self, node: Node, size: int, /) -> Node:
+        """Relink the subtree rooted at node into a perfectly balanced one in O(size). Returns its new root."""
+
+        nodes = []
+        stack = []
+        current = node
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            nodes.append(current)
+            current = current.right
+        return self.__build_balanced(nodes, 0, size)
+
+    def __build_balanced(self, nodes: list, lo: int, hi: int, /) -> Node | None:
+        """Recursive helper for __rebuild(). Links nodes[lo:hi] into a balanced subtree."""
+
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.left = self.__build_balanced(nodes, lo, mid)
+        node.right = self.__build_balanced(nodes, mid + 1, hi)
+        return node
 
     def search(self, value: Any, /) -> Any:
         """Search for a node with the given value and return it. Returns None if not found."""
@@ -95,7 +200,12 @@ class BinarySearchTree:
         """Delete a node with the given value. Handles duplicates and in-order successor if needed."""
 
         self.is_empty()
+        self.__modifications += 1
         self.root = self.__delete_helper(self.root, value)
+        if self.__alpha is not None and self.__size < self.__alpha * self.__max_size:
+            if self.root:
+                self.root = self.__rebuild(self.root, self.__size)
+            self.__max_size = self.__size
 
     def __delete_helper(self, node: Node, value: Any, /):
         """Recursive helper for delete(). Returns the updated subtree after deletion."""
@@ -202,16 +312,11 @@ class BinarySearchTree:
         arr.append(node.value)
 
     def height(self) -> int:
-        """Return the height of the BST."""
-
-        num = self.__height_helper(self.root)
-        return num
-
-    def __height_helper(self, node: Node, /) -> int:
-        """Recursive helper for height(). Computes height of subtree rooted at node."""
-
-        if node is None:
-            return -1
-        if node.left is None and node.right is None:
-            return 0
-        return max(self.__height_helper(node.left), self.__height_helper(node.right)) + 1
\ No newline at end of file
+        """Return the height of the BST. Iterates level by level, so it is safe on degenerate trees."""
+
+        height = -1
+        level = [self.root] if self.root else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child]
+        return height
\ No newline at end of file
@@ -0,0 +1 @@
+from .model import BoundedTree
\ No newline at end of file
@@ -0,0 +1 @@
+from avl_tree.exception import Empty
\ No newline at end of file
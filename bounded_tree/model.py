@@ -0,0 +1,238 @@
+import heapq
+import itertools
+import time
+from typing import Any, Callable
+from avl_tree import AVLTree
+
+
+class BoundedTree:
+    """
+    Ordered cache on top of an AVLTree with a size bound and optional per-entry TTL.
+
+    When `max_size` is set, every insert that exceeds it evicts one
+    occurrence of the smallest (`evict='min'`) or largest (`evict='max'`)
+    value through a single-descent `pop_min()` / `pop_max()`. Entries
+    inserted with a TTL are indexed by expiry time in a heap. Expired
+    entries are purged at the start of every operation (at most
+    `purge_step` of them, or all when it is None), or in one batch with `purge()`.
+    TTL'd values must be hashable.
+
+    Attributes
+    ----------
+    tree : AVLTree
+        The underlying ordered tree.
+    __max_size : int | None
+        Maximum number of elements (including duplicates), or None for no bound.
+    __evict : str
+        'min' or 'max', the end of the key range evicted when over capacity.
+    __ttl : float | None
+        Default time-to-live for new entries, or None for entries that never expire.
+    __clock : Callable[[], float]
+        Time source used for expiry.
+    __purge_step : int | None
+        Maximum number of expired entries purged per operation, or None for all.
+    __expiry_heap : list
+        (expires_at, seq, value) for every TTL'd occurrence, including stale ones.
+    __expiries : dict
+        value -> heap of (expires_at, seq) for its live TTL'd occurrences.
+    __live : set
+        Sequence numbers of live TTL'd occurrences.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        *,
+        evict: str = 'min',
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        purge_step: int | None = None,
+    ):
+
+        if max_size is not None and max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        if evict not in ('min', 'max'):
+            raise ValueError("evict must be 'min' or 'max'")
+        self.tree = AVLTree()
+        self.__max_size = max_size
+        self.__evict = evict
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__purge_step = purge_step
+        self.__expiry_heap = []
+        self.__expiries = {}
+        self.__live = set()
+        self.__seq = itertools.count()
+
+    def size(self) -> int:
+        """
+        Returns the total number of elements, including duplicates.
+        Entries that expired since the last operation are still counted until purged.
+        """
+
+        return self.tree.size()
+
+    def node_count(self) -> int:
+        """
+        Returns the number of distinct values.
+        """
+
+        return self.tree.node_count()
+
+    def is_empty(self):
+        """
+        Raises an Empty exception if the tree has no elements.
+        """
+
+        self.tree.is_empty()
+
+    def insert(self, value: Any, ttl: float | None = None, /):
+        """
+        Inserts a value, optionally with its own TTL (defaults to the tree's TTL).
+        Evicts one occurrence from the configured end if `max_size` is exceeded.
+        """
+
+        self.__purge(self.__purge_step)
+        self.tree.insert(value)
+        if ttl is None:
+            ttl = self.__ttl
+        if ttl is not None:
+            expires_at = self.__clock() + ttl
+            seq = next(self.__seq)
+            heapq.heappush(self.__expiry_heap, (expires_at, seq, value))
+            heapq.heappush(self.__expiries.setdefault(value, []), (expires_at, seq))
+            self.__live.add(seq)
+        if self.__max_size is not None and self.tree.size() > self.__max_size:
+            if self.__evict == 'min':
+                self.__forget(self.tree.pop_min())
+            else:
+                self.__forget(self.tree.pop_max())
+
+    def delete(self, value: Any, /):
+        """
+        Deletes one occurrence of a value. If the value has TTL'd occurrences,
+        the one closest to expiry is the one removed.
+        """
+
+        self.__purge(self.__purge_step)
+        self.tree.delete(value)
+        self.__forget(value)
+
+    def pop_min(self) -> Any:
+        """
+        Removes and returns one occurrence of the smallest live value in a single descent.
+        """
+
+        self.__purge(self.__purge_step)
+        value = self.tree.pop_min()
+        self.__forget(value)
+        return value
+
+    def pop_max(self) -> Any:
+        """
+        Removes and returns one occurrence of the largest live value in a single descent.
+        """
+
+        self.__purge(self.__purge_step)
+        value = self.tree.pop_max()
+        self.__forget(value)
+        return value
+
+    def search(self, value: Any, /):
+        """
+        Searches for a value after purging expired entries.
+
+        Returns
+        -------
+        Node | None
+            The AVL node holding the value, or None if not found.
+        """
+
+        self.__purge(self.__purge_step)
+        return self.tree.search(value)
+
+    def min(self) -> Any:
+        """
+        Returns the smallest value after purging expired entries.
+        """
+
+        self.__purge(self.__purge_step)
+        return self.tree.min()
+
+    def max(self) -> Any:
+        """
+        Returns the largest value after purging expired entries.
+        """
+
+        self.__purge(self.__purge_step)
+        return self.tree.max()
+
+    def in_order(self) -> list:
+        """
+        Returns the distinct values in sorted order after purging all expired entries.
+        """
+
+        self.__purge(None)
+        return self.tree.in_order()
+
+    def purge(self) -> int:
+        """
+        Removes every expired entry in one batch.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+
+        return self.__purge(None)
+
+    def __purge(self, limit: int | None, /) -> int:
+        """
+        Removes expired entries in expiry order, at most `limit` of them (all if None).
+        Stale heap records left by deletes and evictions are skipped.
+        """
+
+        heap = self.__expiry_heap
+        if not heap:
+            return 0
+        now = self.__clock()
+        purged = 0
+        while heap and heap[0][0] <= now and (limit is None or purged < limit):
+            _, seq, value = heapq.heappop(heap)
+            if seq not in self.__live:
+                continue
+            self.__forget(value)
+            self.tree.delete(value)
+            purged += 1
+        if len(heap) > 2 * len(self.__live) + 64:
+            self.__compact_heap()
+        return purged
+
+    def __forget(self, value: Any, /):
+        """
+        Drops the TTL record of the occurrence of `value` closest to expiry, if any.
+        The global heap record becomes stale and is skipped when it surfaces.
+        """
+
+        if not self.__expiries:
+            return
+        expiries = self.__expiries.get(value)
+        if expiries is None:
+            return
+        _, seq = heapq.heappop(expiries)
+        self.__live.discard(seq)
+        if not expiries:
+            del self.__expiries[value]
+
+    def __compact_heap(self):
+        """
+        Rebuilds the expiry heap from live records once stale ones dominate it.
+        """
+
+        self.__expiry_heap = [
+            (expires_at, seq, value)
+            for value, expiries in self.__expiries.items()
+            for expires_at, seq in expiries
+        ]
+        heapq.heapify(self.__expiry_heap)
\ No newline at end of file
@@ -0,0 +1 @@
+from .model import DiskBPlusTree
\ No newline at end of file
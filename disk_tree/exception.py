@@ -0,0 +1,10 @@
+class Empty(Exception):
+    pass
+
+
+class PageOverflow(Exception):
+    pass
+
+
+class CorruptFile(Exception):
+    pass
\ No newline at end of file
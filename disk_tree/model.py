@@ -0,0 +1,445 @@
+import pickle
+from bisect import bisect_left, bisect_right
+from typing import Any
+from .node import LeafPage, InternalPage
+from .pager import Pager
+from .exception import Empty, PageOverflow
+
+
+HEADER_SLACK = 64
+ENTRY_SLACK = 10
+
+
+class DiskBPlusTree:
+    """
+    Disk-backed B+ Tree stored in fixed-size pages of a single file.
+
+    Nodes are loaded through a Pager with an LRU cache limited to
+    `cache_bytes`, so the key set can be much larger than RAM. The
+    algorithms match `b_plus_tree.BPlusTree`: sorted keys searched with
+    bisect, duplicate counts in the leaves, doubly linked leaves for
+    in-order and range scans, and borrow/merge on underflow. Pages freed
+    by merges are reused. Changes reach the file when pages are evicted,
+    and on flush() and close().
+
+    Attributes
+    ----------
+    pager : Pager
+        Page file and cache; exposes the I/O and cache counters.
+    __order : int
+        Maximum number of keys in a leaf and of children in an internal node.
+    __max_key_bytes : int
+        Largest pickled key that still lets a full node fit in one page.
+    """
+
+    def __init__(self, path: str, *, order: int = 64, page_size: int = 4096, cache_bytes: int = 1 << 24):
+
+        self.pager = Pager(path, page_size, cache_bytes)
+        meta = self.pager.meta
+        if 'root' not in meta:
+            if order < 3:
+                raise ValueError('DiskBPlusTree order must be at least 3')
+            root = self.pager.allocate(True)
+            meta.update(root=root.page_id, head=root.page_id, order=order, size=0, node_count=0)
+            self.pager.release()
+        self.__order = meta['order']
+        self.__max_key_bytes = (self.pager.page_size - HEADER_SLACK) // self.__order - ENTRY_SLACK
+        if self.__max_key_bytes < 8:
+            raise ValueError(f'page_size {self.pager.page_size} is too small for order {self.__order}')
+
+    def __enter__(self) -> 'DiskBPlusTree':
+
+        return self
+
+    def __exit__(self, *exc):
+
+        self.close()
+
+    def flush(self):
+        """
+        Writes every dirty page and the header to disk and fsyncs the file.
+        """
+
+        self.pager.flush()
+
+    def close(self):
+        """
+        Flushes and closes the page file.
+        """
+
+        self.pager.close()
+
+    def stats(self) -> dict:
+        """
+        Returns the page cache and I/O counters.
+
+        Returns
+        -------
+        dict
+            reads, writes, hits, misses, hit_rate and cached_pages.
+        """
+
+        pager = self.pager
+        lookups = pager.hits + pager.misses
+        return {
+            'reads': pager.reads,
+            'writes': pager.writes,
+            'hits': pager.hits,
+            'misses': pager.misses,
+            'hit_rate': pager.hits / lookups if lookups else 0.0,
+            'cached_pages': pager.cached_pages(),
+        }
+
+    def order(self) -> int:
+        """
+        Returns the fanout of the tree.
+        """
+
+        return self.__order
+
+    def node_count(self) -> int:
+        """
+        Returns the total number of distinct values in the tree,
+        excluding duplicates.
+        """
+
+        return self.pager.meta['node_count']
+
+    def size(self) -> int:
+        """
+        Returns the total number of elements in the tree,
+        including duplicates.
+        """
+
+        return self.pager.meta['size']
+
+    def is_empty(self):
+        """
+        Checks if the tree is empty.
+        Raises an Empty exception if the tree has no values.
+        """
+
+        if self.pager.meta['node_count'] == 0:
+            raise Empty('DiskBPlusTree is empty')
+
+    def insert(self, value: Any, /):
+        """
+        Inserts a new value into the tree.
+        If the value already exists, increments its count.
+        Raises PageOverflow, before changing anything, if the pickled value is too large for a page.
+        """
+
+        if len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)) > self.__max_key_bytes:
+            raise PageOverflow(f'value needs more than {self.__max_key_bytes} bytes; use a larger page_size or smaller order')
+        meta = self.pager.meta
+        try:
+            split = self.__insert_helper(self.pager.get(meta['root']), value)
+            if split:
+                separator, right = split
+                root = self.pager.allocate(False)
+                root.keys.append(separator)
+                root.children.extend((meta['root'], right.page_id))
+                meta['root'] = root.page_id
+        finally:
+            self.pager.release()
+
+    def __insert_helper(self, node: LeafPage | InternalPage, value: Any, /) -> tuple | None:
+        """
+        Helper function for insertion. Works recursively.
+
+        Returns
+        -------
+        tuple | None
+            (separator, new right sibling) if the node was split, otherwise None.
+        """
+
+        meta = self.pager.meta
+        if isinstance(node, LeafPage):
+            i = bisect_left(node.keys, value)
+            self.pager.mark_dirty(node)
+            meta['size'] += 1
+            if i < len(node.keys) and node.keys[i] == value:
+                node.counts[i] += 1
+                return None
+            node.keys.insert(i, value)
+            node.counts.insert(i, 1)
+            meta['node_count'] += 1
+            if len(node.keys) > self.__order:
+                return self.__split_leaf(node)
+            return None
+        i = bisect_right(node.keys, value)
+        split = self.__insert_helper(self.pager.get(node.children[i]), value)
+        if split is None:
+            return None
+        separator, right = split
+        node.keys.insert(i, separator)
+        node.children.insert(i + 1, right.page_id)
+        self.pager.mark_dirty(node)
+        if len(node.children) > self.__order:
+            return self.__split_internal(node)
+        return None
+
+    def __split_leaf(self, node: LeafPage, /) -> tuple:
+        """
+        Moves the upper half of a leaf into a new right sibling and links it into the leaf chain.
+        """
+
+        mid = len(node.keys) // 2
+        right = self.pager.allocate(True)
+        right.keys = node.keys[mid:]
+        right.counts = node.counts[mid:]
+        del node.keys[mid:]
+        del node.counts[mid:]
+        right.next = node.next
+        right.prev = node.page_id
+        if node.next is not None:
+            following = self.pager.get(node.next)
+            following.prev = right.page_id
+            self.pager.mark_dirty(following)
+        node.next = right.page_id
+        return right.keys[0], right
+
+    def __split_internal(self, node: InternalPage, /) -> tuple:
+        """
+        Moves the upper half of an internal node into a new right sibling.
+        The middle key is pushed up to the parent.
+        """
+
+        mid = len(node.keys) // 2
+        separator = node.keys[mid]
+        right = self.pager.allocate(False)
+        right.keys = node.keys[mid + 1:]
+        right.children = node.children[mid + 1:]
+        del node.keys[mid:]
+        del node.children[mid + 1:]
+        return separator, right
+
+    def delete(self, value: Any, /):
+        """
+        Deletes a value from the tree.
+        Decreases the count if duplicates exist, otherwise removes the key
+        and borrows from or merges with a sibling when a node underflows.
+        """
+
+        self.is_empty()
+        meta = self.pager.meta
+        try:
+            root = self.pager.get(meta['root'])
+            self.__delete_helper(root, value)
+            if isinstance(root, InternalPage) and len(root.children) == 1:
+                meta['root'] = root.children[0]
+                self.pager.free(root)
+        finally:
+            self.pager.release()
+
+    def __delete_helper(self, node: LeafPage | InternalPage, value: Any, /):
+
+        meta = self.pager.meta
+        if isinstance(node, LeafPage):
+            i = bisect_left(node.keys, value)
+            if i == len(node.keys) or node.keys[i] != value:
+                return
+            self.pager.mark_dirty(node)
+            meta['size'] -= 1
+            if node.counts[i] > 1:
+                node.counts[i] -= 1
+                return
+            del node.keys[i]
+            del node.counts[i]
+            meta['node_count'] -= 1
+            return
+        i = bisect_right(node.keys, value)
+        child = self.pager.get(node.children[i])
+        self.__delete_helper(child, value)
+        if self.__is_underfull(child):
+            self.__rebalance(node, i)
+
+    def __is_underfull(self, node: LeafPage | InternalPage, /) -> bool:
+
+        if isinstance(node, LeafPage):
+            return len(node.keys) < self.__order // 2
+        return len(node.children) < (self.__order + 1) // 2
+
+    def __can_lend(self, node: LeafPage | InternalPage, /) -> bool:
+
+        if isinstance(node, LeafPage):
+            return len(node.keys) > self.__order // 2
+        return len(node.children) > (self.__order + 1) // 2
+
+    def __rebalance(self, parent: InternalPage, i: int, /):
+        """
+        Fixes an underfull child at index `i` by borrowing from a sibling,
+        or by merging it with one when neither sibling can lend.
+        """
+
+        pager = self.pager
+        child = pager.get(parent.children[i])
+        left = pager.get(parent.children[i - 1]) if i > 0 else None
+        right = pager.get(parent.children[i + 1]) if i + 1 < len(parent.children) else None
+        pager.mark_dirty(parent)
+        pager.mark_dirty(child)
+        if isinstance(child, LeafPage):
+            if left and self.__can_lend(left):
+                child.keys.insert(0, left.keys.pop())
+                child.counts.insert(0, left.counts.pop())
+                parent.keys[i - 1] = child.keys[0]
+                pager.mark_dirty(left)
+            elif right and self.__can_lend(right):
+                child.keys.append(right.keys.pop(0))
+                child.counts.append(right.counts.pop(0))
+                parent.keys[i] = right.keys[0]
+                pager.mark_dirty(right)
+            elif left:
+                self.__merge_leaves(left, child)
+                del parent.keys[i - 1]
+                del parent.children[i]
+            else:
+                self.__merge_leaves(child, right)
+                del parent.keys[i]
+                del parent.children[i + 1]
+            return
+        if left and self.__can_lend(left):
+            child.keys.insert(0, parent.keys[i - 1])
+            child.children.insert(0, left.children.pop())
+            parent.keys[i - 1] = left.keys.pop()
+            pager.mark_dirty(left)
+        elif right and self.__can_lend(right):
+            child.keys.append(parent.keys[i])
+            child.children.append(right.children.pop(0))
+            parent.keys[i] = right.keys.pop(0)
+            pager.mark_dirty(right)
+        elif left:
+            left.keys.append(parent.keys[i - 1])
+            left.keys.extend(child.keys)
+            left.children.extend(child.children)
+            pager.mark_dirty(left)
+            pager.free(child)
+            del parent.keys[i - 1]
+            del parent.children[i]
+        else:
+            child.keys.append(parent.keys[i])
+            child.keys.extend(right.keys)
+            child.children.extend(right.children)
+            pager.free(right)
+            del parent.keys[i]
+            del parent.children[i + 1]
+
+    def __merge_leaves(self, left: LeafPage, right: LeafPage, /):
+        """
+        Appends `right` to `left`, unlinks `right` from the leaf chain and frees its page.
+        """
+
+        left.keys.extend(right.keys)
+        left.counts.extend(right.counts)
+        left.next = right.next
+        if right.next is not None:
+            following = self.pager.get(right.next)
+            following.prev = left.page_id
+            self.pager.mark_dirty(following)
+        self.pager.mark_dirty(left)
+        self.pager.free(right)
+
+    def __find_leaf(self, value: Any, /) -> LeafPage:
+
+        node = self.pager.get(self.pager.meta['root'])
+        while isinstance(node, InternalPage):
+            node = self.pager.get(node.children[bisect_right(node.keys, value)])
+        return node
+
+    def search(self, value: Any, /) -> LeafPage | None:
+        """
+        Searches for a value in the tree.
+
+        Returns
+        -------
+        LeafPage | None
+            Returns the leaf page holding the value, or None if not found.
+        """
+
+        try:
+            leaf = self.__find_leaf(value)
+            i = bisect_left(leaf.keys, value)
+            if i < len(leaf.keys) and leaf.keys[i] == value:
+                return leaf
+            return None
+        finally:
+            self.pager.release()
+
+    def count(self, value: Any, /) -> int:
+        """
+        Returns the number of duplicates stored for a value (0 if absent).
+        """
+
+        try:
+            leaf = self.__find_leaf(value)
+            i = bisect_left(leaf.keys, value)
+            if i < len(leaf.keys) and leaf.keys[i] == value:
+                return leaf.counts[i]
+            return 0
+        finally:
+            self.pager.release()
+
+    def __contains__(self, value: Any, /) -> bool:
+
+        return self.search(value) is not None
+
+    def min(self):
+        """
+        Returns the minimum value in the tree.
+        """
+
+        self.is_empty()
+        try:
+            return self.pager.get(self.pager.meta['head']).keys[0]
+        finally:
+            self.pager.release()
+
+    def max(self):
+        """
+        Returns the maximum value in the tree.
+        """
+
+        self.is_empty()
+        try:
+            node = self.pager.get(self.pager.meta['root'])
+            while isinstance(node, InternalPage):
+                node = self.pager.get(node.children[-1])
+            return node.keys[-1]
+        finally:
+            self.pager.release()
+
+    def in_order(self) -> list:
+        """
+        Returns the distinct values of the tree in sorted order by walking the leaf chain.
+        """
+
+        arr = []
+        page_id = self.pager.meta['head']
+        while page_id is not None:
+            leaf = self.pager.get(page_id)
+            arr.extend(leaf.keys)
+            page_id = leaf.next
+            self.pager.release()
+        return arr
+
+    def range(self, lo: Any, hi: Any, /) -> list:
+        """
+        Returns the distinct values `v` with `lo <= v <= hi` in sorted order.
+        Descends once to the leaf holding `lo`, then walks the leaf chain.
+        """
+
+        arr = []
+        try:
+            leaf = self.__find_leaf(lo)
+            i = bisect_left(leaf.keys, lo)
+            while True:
+                j = bisect_right(leaf.keys, hi)
+                arr.extend(leaf.keys[i:j])
+                if j < len(leaf.keys) or leaf.next is None:
+                    break
+                self.pager.release()
+                leaf = self.pager.get(leaf.next)
+                i = 0
+        finally:
+            self.pager.release()
+        return arr
\ No newline at end of file
@@ -0,0 +1,18 @@
+class LeafPage:
+
+    def __init__(self, page_id, /):
+
+        self.page_id = page_id
+        self.keys = []
+        self.counts = []
+        self.next = None
+        self.prev = None
+
+
+class InternalPage:
+
+    def __init__(self, page_id, /):
+
+        self.page_id = page_id
+        self.keys = []
+        self.children = []
\ No newline at end of file
@@ -0,0 +1,188 @@
+import os
+import pickle
+from collections import OrderedDict
+from .node import LeafPage, InternalPage
+from .exception import PageOverflow, CorruptFile
+
+
+MAGIC = b'BPTREE01'
+LENGTH_BYTES = 4
+
+
+class Pager:
+    """
+    Fixed-size page file with an LRU page cache.
+
+    Page 0 holds the header (a pickled dict of tree metadata); every other
+    page holds one node, or a link in the free-page chain. Pages are read
+    and written with `os.pread` / `os.pwrite`. Decoded nodes stay in an
+    LRU cache bounded by `cache_bytes // page_size` pages, and dirty pages
+    are written back when they are evicted or flushed. Eviction only
+    happens in release(), between tree operations, so a node the tree is
+    still holding is never written back half-modified.
+
+    Attributes
+    ----------
+    page_size : int
+        Size of every page in bytes.
+    meta : dict
+        Header metadata, written to page 0 on flush.
+    reads, writes : int
+        Pages read from and written to the file.
+    hits, misses : int
+        Cache lookups served from memory and from disk.
+    __capacity : int
+        Maximum number of pages kept in the cache between operations.
+    __cache : OrderedDict
+        page id -> decoded node, least recently used first.
+    __dirty : set
+        Ids of cached pages that differ from the file.
+    """
+
+    def __init__(self, path: str, page_size: int, cache_bytes: int, /):
+
+        self.__fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.__capacity = max(cache_bytes // page_size, 1)
+        self.__cache = OrderedDict()
+        self.__dirty = set()
+        self.reads = self.writes = self.hits = self.misses = 0
+        file_size = os.fstat(self.__fd).st_size
+        if file_size == 0:
+            self.page_size = page_size
+            self.meta = {'page_count': 1, 'free': None}
+            self.__write_header()
+            return
+        raw = os.pread(self.__fd, 64, 0)
+        if not raw.startswith(MAGIC):
+            raise CorruptFile(f'{path} is not a page file')
+        self.page_size = int.from_bytes(raw[len(MAGIC):len(MAGIC) + LENGTH_BYTES], 'big')
+        self.__capacity = max(cache_bytes // self.page_size, 1)
+        self.meta = self.__decode(self.__read(0)[len(MAGIC) + LENGTH_BYTES:], 0)
+
+    def __read(self, page_id: int, /) -> bytes:
+
+        self.reads += 1
+        return os.pread(self.__fd, self.page_size, page_id * self.page_size)
+
+    def __write(self, page_id: int, payload: bytes, /):
+
+        if len(payload) > self.page_size:
+            raise PageOverflow(f'page {page_id} needs {len(payload)} bytes, page size is {self.page_size}')
+        self.writes += 1
+        os.pwrite(self.__fd, payload.ljust(self.page_size, b'\0'), page_id * self.page_size)
+
+    def __encode(self, record: object, /) -> bytes:
+
+        data = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+        return len(data).to_bytes(LENGTH_BYTES, 'big') + data
+
+    def __decode(self, raw: bytes, page_id: int, /) -> object:
+        """
+        Unpickles a page payload. A page that was never written, or that was
+        torn by a crash, raises CorruptFile instead of the raw pickle error.
+        """
+
+        length = int.from_bytes(raw[:LENGTH_BYTES], 'big')
+        try:
+            return pickle.loads(raw[LENGTH_BYTES:LENGTH_BYTES + length])
+        except (EOFError, pickle.UnpicklingError, ValueError, IndexError) as error:
+            raise CorruptFile(f'page {page_id} cannot be decoded') from error
+
+    def __write_header(self):
+
+        prefix = MAGIC + self.page_size.to_bytes(LENGTH_BYTES, 'big')
+        self.__write(0, prefix + self.__encode(self.meta))
+
+    def get(self, page_id: int, /) -> LeafPage | InternalPage:
+        """
+        Returns the node stored in a page, from the cache or from disk.
+        """
+
+        node = self.__cache.get(page_id)
+        if node is not None:
+            self.hits += 1
+            self.__cache.move_to_end(page_id)
+        else:
+            self.misses += 1
+            record = self.__decode(self.__read(page_id), page_id)
+            shape = (record[0], len(record)) if isinstance(record, tuple) and record else None
+            if shape == ('L', 5):
+                node = LeafPage(page_id)
+                _, node.keys, node.counts, node.next, node.prev = record
+            elif shape == ('I', 3):
+                node = InternalPage(page_id)
+                _, node.keys, node.children = record
+            else:
+                raise CorruptFile(f'page {page_id} does not hold a node')
+            self.__cache[page_id] = node
+        return node
+
+    def allocate(self, leaf: bool, /) -> LeafPage | InternalPage:
+        """
+        Creates a new, dirty node in a free page, reusing freed pages first.
+        """
+
+        free = self.meta['free']
+        if free is not None:
+            page_id = free
+            self.meta['free'] = self.__decode(self.__read(page_id), page_id)[1]
+        else:
+            page_id = self.meta['page_count']
+            self.meta['page_count'] += 1
+        node = LeafPage(page_id) if leaf else InternalPage(page_id)
+        self.__cache[page_id] = node
+        self.__dirty.add(page_id)
+        return node
+
+    def free(self, node: LeafPage | InternalPage, /):
+        """
+        Returns a node's page to the free-page chain.
+        """
+
+        page_id = node.page_id
+        self.__cache.pop(page_id, None)
+        self.__dirty.discard(page_id)
+        self.__write(page_id, self.__encode(('F', self.meta['free'])))
+        self.meta['free'] = page_id
+
+    def mark_dirty(self, node: LeafPage | InternalPage, /):
+
+        self.__dirty.add(node.page_id)
+
+    def release(self):
+        """
+        Ends an operation: evicts least recently used pages until the cache is within capacity.
+        """
+
+        while len(self.__cache) > self.__capacity:
+            page_id, node = self.__cache.popitem(last=False)
+            if page_id in self.__dirty:
+                self.__write_node(node)
+
+    def __write_node(self, node: LeafPage | InternalPage, /):
+
+        if isinstance(node, LeafPage):
+            record = ('L', node.keys, node.counts, node.next, node.prev)
+        else:
+            record = ('I', node.keys, node.children)
+        self.__write(node.page_id, self.__encode(record))
+        self.__dirty.discard(node.page_id)
+
+    def flush(self):
+        """
+        Writes every dirty page and the header, then fsyncs the file.
+        """
+
+        for page_id in sorted(self.__dirty):
+            self.__write_node(self.__cache[page_id])
+        self.__write_header()
+        os.fsync(self.__fd)
+
+    def cached_pages(self) -> int:
+
+        return len(self.__cache)
+
+    def close(self):
+
+        self.flush()
+        os.close(self.__fd)
\ No newline at end of file
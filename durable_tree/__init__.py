@@ -0,0 +1 @@
+from .model import DurableTree
\ No newline at end of file
@@ -0,0 +1,2 @@
+class CorruptSnapshot(Exception):
+    pass
\ No newline at end of file
@@ -0,0 +1,336 @@
+import os
+import pickle
+import threading
+from collections import deque
+from typing import Any, Callable, Iterator
+from avl_tree import AVLTree
+from .exception import CorruptSnapshot
+
+
+SNAPSHOT = 'snapshot'
+JOURNAL = 'journal.'
+CHUNK = 1024
+
+
+class DurableTree:
+    """
+    Write-ahead journal around an in-memory tree (AVLTree, BinarySearchTree or
+    any tree with the same insert/delete/root API).
+
+    Every successful insert/delete is appended to a buffered journal file.
+    With group commit on, the journal is fsynced once per `commit_every`
+    records, and on sync() and close(). With it off, every write is
+    fsynced before returning. On open, the latest snapshot is loaded and
+    the journal segments written after it are replayed. compact() writes a
+    new snapshot from an in-order stream of (value, count) pairs on a
+    background thread, then drops the journal segments it covers.
+
+    Directory layout: `snapshot` holds the generation it covers followed by
+    chunks of (value, count) pairs; `journal.<generation>` holds the pickled
+    ('i' | 'd', value) records of one generation.
+
+    Attributes
+    ----------
+    tree : Any
+        The in-memory tree. Read from it directly; write through this wrapper.
+    __directory : str
+        Directory holding the snapshot and journal segments.
+    __group_commit : bool
+        Whether fsyncs are batched.
+    __commit_every : int
+        Records per fsync when group commit is on.
+    __generation : int
+        Generation of the journal segment currently appended to.
+    __journal : BufferedWriter
+        Open journal segment.
+    __pending : int
+        Records written since the last fsync.
+    __compactor : threading.Thread | None
+        Background snapshot writer, if one is running.
+    __compact_error : BaseException | None
+        Exception raised by the last background snapshot writer, re-raised by join().
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        factory: Callable[[], Any] = AVLTree,
+        group_commit: bool = True,
+        commit_every: int = 64,
+    ):
+
+        if commit_every < 1:
+            raise ValueError('commit_every must be at least 1')
+        os.makedirs(directory, exist_ok=True)
+        self.tree = factory()
+        self.__directory = directory
+        self.__group_commit = group_commit
+        self.__commit_every = commit_every
+        self.__pending = 0
+        self.__compactor = None
+        self.__compact_error = None
+        self.__generation = self.__recover()
+        self.__journal = open(self.__journal_path(self.__generation), 'ab')
+
+    def __enter__(self) -> 'DurableTree':
+
+        return self
+
+    def __exit__(self, *exc):
+
+        self.close()
+
+    def __journal_path(self, generation: int, /) -> str:
+
+        return os.path.join(self.__directory, f'{JOURNAL}{generation}')
+
+    def __journal_generations(self) -> list:
+        """
+        Returns the generations of the journal segments on disk, in ascending order.
+        """
+
+        generations = []
+        for name in os.listdir(self.__directory):
+            if name.startswith(JOURNAL) and name[len(JOURNAL):].isdigit():
+                generations.append(int(name[len(JOURNAL):]))
+        return sorted(generations)
+
+    def __recover(self) -> int:
+        """
+        Loads the snapshot, replays the journal segments written after it and
+        removes the ones it already covers.
+
+        Returns
+        -------
+        int
+            The generation new records should be appended to.
+        """
+
+        generation = self.__load_snapshot()
+        latest = generation
+        for segment in self.__journal_generations():
+            if segment < generation:
+                os.remove(self.__journal_path(segment))
+                continue
+            self.__replay(self.__journal_path(segment))
+            latest = segment
+        return latest
+
+    def __load_snapshot(self) -> int:
+        """
+        Rebuilds the tree from the snapshot file, if one exists.
+
+        Returns
+        -------
+        int
+            The first journal generation not covered by the snapshot (0 without a snapshot).
+        """
+
+        path = os.path.join(self.__directory, SNAPSHOT)
+        if not os.path.exists(path):
+            return 0
+        with open(path, 'rb') as file:
+            try:
+                generation = pickle.load(file)
+                items = []
+                while (chunk := pickle.load(file)) is not None:
+                    items.extend(chunk)
+            except (EOFError, pickle.UnpicklingError) as error:
+                raise CorruptSnapshot(f'{path} is truncated or corrupt') from error
+        for value, count in self.__balanced_order(items):
+            for _ in range(count):
+                self.tree.insert(value)
+        return generation
+
+    def __balanced_order(self, items: list, /) -> Iterator[tuple]:
+        """
+        Yields sorted items middle-first, level by level, so that rebuilding an
+        unbalanced BinarySearchTree from a snapshot does not degrade into a list.
+        """
+
+        ranges = deque([(0, len(items))])
+        while ranges:
+            lo, hi = ranges.popleft()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            yield items[mid]
+            ranges.append((lo, mid))
+            ranges.append((mid + 1, hi))
+
+    def __replay(self, path: str, /):
+        """
+        Applies the records of one journal segment to the tree. A torn record at the
+        end of the file (from a crash mid-write) is cut off so appends continue after the last good record.
+        """
+
+        with open(path, 'rb+') as file:
+            good = 0
+            while True:
+                try:
+                    op, value = pickle.load(file)
+                except EOFError:
+                    break
+                except (pickle.UnpicklingError, ValueError, TypeError):
+                    file.truncate(good)
+                    break
+                if op == 'i':
+                    self.tree.insert(value)
+                elif self.tree.size():
+                    self.tree.delete(value)
+                good = file.tell()
+            if good < os.fstat(file.fileno()).st_size:
+                file.truncate(good)
+
+    def insert(self, value: Any, /):
+        """
+        Inserts a value into the tree and journals it.
+        """
+
+        self.tree.insert(value)
+        self.__append('i', value)
+
+    def delete(self, value: Any, /):
+        """
+        Deletes a value from the tree and journals it.
+        Raises the tree's Empty exception, without journaling, if the tree is empty.
+        """
+
+        self.tree.delete(value)
+        self.__append('d', value)
+
+    def __append(self, op: str, value: Any, /):
+
+        self.__journal.write(pickle.dumps((op, value), pickle.HIGHEST_PROTOCOL))
+        self.__pending += 1
+        if not self.__group_commit or self.__pending >= self.__commit_every:
+            self.sync()
+
+    def sync(self):
+        """
+        Flushes buffered journal records and fsyncs them to disk.
+        """
+
+        if self.__pending == 0:
+            return
+        self.__journal.flush()
+        os.fsync(self.__journal.fileno())
+        self.__pending = 0
+
+    def compact(self, wait: bool = False, /):
+        """
+        Starts a new journal generation and writes a snapshot of the current tree
+        on a background thread. Once the snapshot is safely on disk, the journal
+        segments it covers are deleted.
+
+        The (value, count) pairs are captured synchronously so the tree can keep
+        changing while the snapshot is written.
+
+        Parameters
+        ----------
+        wait : bool
+            If True, blocks until the snapshot is written.
+        """
+
+        self.join()
+        self.sync()
+        self.__journal.close()
+        self.__generation += 1
+        self.__journal = open(self.__journal_path(self.__generation), 'ab')
+        items = list(self.__items())
+        self.__compactor = threading.Thread(
+            target=self.__run_compactor, args=(items, self.__generation), daemon=True
+        )
+        self.__compactor.start()
+        if wait:
+            self.join()
+
+    def __items(self) -> Iterator[tuple]:
+        """
+        Iterative in-order walk over the tree's nodes yielding (value, count) for live nodes.
+        """
+
+        stack = []
+        current = self.tree.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            if current.count: # skip AVLTree lazy-delete tombstones
+                yield current.value, current.count
+            current = current.right
+
+    def __run_compactor(self, items: list, generation: int, /):
+        """
+        Background thread body. Keeps any error from the snapshot writer so join() can re-raise it.
+        """
+
+        try:
+            self.__write_snapshot(items, generation)
+        except BaseException as error:
+            self.__compact_error = error
+
+    def __write_snapshot(self, items: list, generation: int, /):
+        """
+        Writes the snapshot to a temporary file, fsyncs it, atomically replaces
+        the previous snapshot and removes the journal segments it covers.
+        """
+
+        path = os.path.join(self.__directory, SNAPSHOT)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as file:
+            pickle.dump(generation, file, pickle.HIGHEST_PROTOCOL)
+            for i in range(0, len(items), CHUNK):
+                pickle.dump(items[i:i + CHUNK], file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(None, file, pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, path)
+        self.__fsync_directory()
+        for segment in self.__journal_generations():
+            if segment < generation:
+                os.remove(self.__journal_path(segment))
+
+    def __fsync_directory(self):
+        """
+        Makes the snapshot rename durable on filesystems that support fsync on directories.
+        """
+
+        try:
+            fd = os.open(self.__directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def join(self):
+        """
+        Waits for a running background compaction to finish.
+        Re-raises the exception that made it fail, if any; the journal
+        segments it would have removed are kept, so no data is lost.
+        """
+
+        if self.__compactor is not None:
+            self.__compactor.join()
+            self.__compactor = None
+        error, self.__compact_error = self.__compact_error, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        """
+        Waits for compaction, fsyncs pending records and closes the journal.
+        A failed compaction is re-raised after the journal is closed.
+        """
+
+        try:
+            self.join()
+        finally:
+            self.sync()
+            self.__journal.close()
\ No newline at end of file
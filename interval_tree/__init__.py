@@ -0,0 +1 @@
+from .model import IntervalTree
\ No newline at end of file
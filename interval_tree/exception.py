@@ -0,0 +1,2 @@
+class Empty(Exception):
+    pass
\ No newline at end of file
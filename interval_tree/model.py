@@ -0,0 +1,425 @@
+from typing import Any, Iterable
+from .node import Node
+from .exception import Empty
+
+
+class IntervalTree:
+    """
+    Interval Tree implemented as an AVL tree, modeled on AVLTree.
+
+    Closed intervals [start, end] are ordered by (start, end), and every
+    node also caches `max_end`, the largest end point in its subtree.
+    Rotations and rebalancing keep `max_end` up to date, so an overlap
+    query can skip any subtree whose `max_end` lies before the query.
+    Equal intervals are stored once with a duplicate `count`.
+
+    Attributes
+    ----------
+    root : Node
+        Root node of the interval tree.
+    __size : int
+        Total number of intervals in the tree (including duplicates).
+    __node_count : int
+        Total number of nodes in the tree (excluding duplicates).
+    """
+
+    def __init__(self):
+
+        self.root = None
+        self.__size = 0
+        self.__node_count = 0
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[tuple], /) -> 'IntervalTree':
+        """
+        Builds a balanced interval tree from (start, end) pairs in O(n log n)
+        for the sort plus O(n) for the construction.
+
+        Returns
+        -------
+        IntervalTree
+            A new tree holding every given interval.
+        """
+
+        tree = cls()
+        items = []
+        for start, end in sorted(intervals):
+            tree.__check(start, end)
+            if items and items[-1][0] == start and items[-1][1] == end:
+                items[-1][2] += 1
+            else:
+                items.append([start, end, 1])
+            tree.__size += 1
+        tree.__node_count = len(items)
+        tree.root = tree.__build(items, 0, len(items))
+        return tree
+
+    def __build(self, items: list, lo: int, hi: int, /) -> Node | None:
+        """
+        Recursive helper for from_intervals(). Builds a balanced subtree from items[lo:hi].
+        """
+
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        start, end, count = items[mid]
+        node = Node(start, end)
+        node.count = count
+        node.left = self.__build(items, lo, mid)
+        node.right = self.__build(items, mid + 1, hi)
+        self.__update(node)
+        return node
+
+    def node_count(self) -> int:
+        """
+        Returns the total number of distinct intervals in the tree,
+        excluding duplicates.
+
+        Returns
+        -------
+        int
+            Number of unique nodes in the tree.
+        """
+
+        return self.__node_count
+
+    def size(self) -> int:
+        """
+        Returns the total number of intervals in the tree,
+        including duplicates.
+
+        Returns
+        -------
+        int
+            Total count of intervals stored in the tree.
+        """
+
+        return self.__size
+
+    def is_empty(self):
+        """
+        Checks if the interval tree is empty.
+        Raises an Empty exception if the tree has no nodes.
+        """
+
+        if self.__node_count == 0:
+            raise Empty('IntervalTree is empty')
+
+    def __check(self, start: Any, end: Any, /):
+
+        if end < start:
+            raise ValueError(f'interval end {end!r} is before start {start!r}')
+
+    def insert(self, start: Any, end: Any, /):
+        """
+        Inserts the interval [start, end] into the tree.
+        If the interval already exists, increments its count.
+        After insertion, checks balance and performs rotations if necessary.
+        """
+
+        self.__check(start, end)
+        self.root = self.__insert_helper(self.root, start, end)
+
+    def __insert_helper(self, node: Node | None, start: Any, end: Any, /) -> Node:
+        """
+        Helper function for insertion. Works recursively.
+
+        Returns
+        -------
+        Node
+            The updated node (may be the new root after rotation).
+        """
+
+        if node is None:
+            self.__size += 1
+            self.__node_count += 1
+            return Node(start, end)
+        key = (start, end)
+        if key < (node.start, node.end):
+            node.left = self.__insert_helper(node.left, start, end)
+        elif (node.start, node.end) < key:
+            node.right = self.__insert_helper(node.right, start, end)
+        else:
+            node.count += 1
+            self.__size += 1
+            return node
+        return self.__rebalance(node)
+
+    def delete(self, start: Any, end: Any, /):
+        """
+        Deletes the interval [start, end] from the tree.
+        Decreases the count if duplicates exist and rebalances after removal.
+        """
+
+        self.is_empty()
+        self.root = self.__delete_helper(self.root, start, end)
+
+    def __delete_helper(self, node: Node | None, start: Any, end: Any, /) -> Node | None:
+
+        if node is None:
+            return None
+        key = (start, end)
+        if key < (node.start, node.end):
+            node.left = self.__delete_helper(node.left, start, end)
+        elif (node.start, node.end) < key:
+            node.right = self.__delete_helper(node.right, start, end)
+        elif node.count > 1:
+            node.count -= 1
+            self.__size -= 1
+            return node
+        elif node.left and node.right:
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.start, node.end, node.count = successor.start, successor.end, successor.count
+            successor.count = 1
+            node.right = self.__delete_helper(node.right, node.start, node.end)
+        else:
+            self.__size -= 1
+            self.__node_count -= 1
+            return node.left or node.right
+        return self.__rebalance(node)
+
+    def __rebalance(self, node: Node, /) -> Node:
+        """
+        Restores the AVL property at `node` and refreshes its height and max_end.
+
+        Returns
+        -------
+        Node
+            The new root of the subtree.
+        """
+
+        bf = self.get_balance(node)
+        if bf < -1:
+            if self.get_balance(node.right) <= 0: # right-right
+                return self.__rotate_left(node)
+            else: # right-left
+                node.right = self.__rotate_right(node.right)
+                return self.__rotate_left(node)
+        elif 1 < bf:
+            if 0 <= self.get_balance(node.left): # left-left
+                return self.__rotate_right(node)
+            else: # left-right
+                node.left = self.__rotate_left(node.left)
+                return self.__rotate_right(node)
+        self.__update(node)
+        return node
+
+    def __update(self, node: Node, /):
+        """
+        Recomputes the height and max_end of a node from its children.
+        """
+
+        left, right = node.left, node.right
+        node.height = 1 + max(left.height if left else 0, right.height if right else 0)
+        max_end = node.end
+        if left and max_end < left.max_end:
+            max_end = left.max_end
+        if right and max_end < right.max_end:
+            max_end = right.max_end
+        node.max_end = max_end
+
+    def __rotate_left(self, x: Node, /) -> Node:
+        """
+        Performs a Left rotation (RR case).
+
+        Returns
+        -------
+        Node
+            The new root of the rotated subtree.
+        """
+
+        y = x.right
+        x.right = y.left
+        y.left = x
+        self.__update(x)
+        self.__update(y)
+        return y
+
+    def __rotate_right(self, x: Node, /) -> Node:
+        """
+        Performs a Right rotation (LL case).
+
+        Returns
+        -------
+        Node
+            The new root of the rotated subtree.
+        """
+
+        y = x.left
+        x.left = y.right
+        y.right = x
+        self.__update(x)
+        self.__update(y)
+        return y
+
+    def get_balance(self, node: Node | None, /) -> int:
+        """
+        Calculates the balance factor (BF) of a node.
+
+        Returns
+        -------
+        int
+            BF = height(left) - height(right)
+        """
+
+        if node is None:
+            return 0
+        return (node.left.height if node.left else 0) - (node.right.height if node.right else 0)
+
+    def search(self, start: Any, end: Any, /) -> Node:
+        """
+        Searches for the exact interval [start, end].
+
+        Returns
+        -------
+        Node | None
+            Returns the node holding the interval, or None if not found.
+        """
+
+        key = (start, end)
+        current = self.root
+        while current:
+            if key < (current.start, current.end):
+                current = current.left
+            elif (current.start, current.end) < key:
+                current = current.right
+            else:
+                break
+        return current
+
+    def overlapping(self, lo: Any, hi: Any = None, /) -> list:
+        """
+        Returns the distinct intervals that overlap the point `lo`, or the
+        closed range [lo, hi] when `hi` is given, ordered by start.
+        Subtrees whose max_end is before `lo`, and right subtrees starting after `hi`, are skipped.
+
+        Returns
+        -------
+        list
+            (start, end) pairs of the overlapping intervals.
+        """
+
+        if hi is None:
+            hi = lo
+        arr = []
+        self.__overlapping_helper(self.root, lo, hi, arr)
+        return arr
+
+    def __overlapping_helper(self, node: Node | None, lo: Any, hi: Any, arr: list, /):
+
+        if node is None or node.max_end < lo:
+            return
+        self.__overlapping_helper(node.left, lo, hi, arr)
+        if hi < node.start:
+            return
+        if not node.end < lo:
+            arr.append((node.start, node.end))
+        self.__overlapping_helper(node.right, lo, hi, arr)
+
+    def any_overlap(self, lo: Any, hi: Any = None, /) -> bool:
+        """
+        Checks whether any interval overlaps the point `lo`, or the closed range [lo, hi].
+        Follows a single root-to-leaf path.
+
+        Returns
+        -------
+        bool
+            True if at least one stored interval overlaps.
+        """
+
+        if hi is None:
+            hi = lo
+        current = self.root
+        while current:
+            if not (hi < current.start or current.end < lo):
+                return True
+            if current.left and not current.left.max_end < lo:
+                current = current.left
+            else:
+                current = current.right
+        return False
+
+    def min(self) -> tuple:
+        """
+        Returns the interval with the smallest (start, end).
+
+        Returns
+        -------
+        tuple
+            The (start, end) pair.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.left:
+            current = current.left
+        return current.start, current.end
+
+    def max(self) -> tuple:
+        """
+        Returns the interval with the largest (start, end).
+
+        Returns
+        -------
+        tuple
+            The (start, end) pair.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.right:
+            current = current.right
+        return current.start, current.end
+
+    def in_order(self) -> list:
+        """
+        Returns (start, end) pairs of the tree in in-order traversal.
+        """
+
+        arr = []
+        self.__in_order_helper(self.root, arr)
+        return arr
+
+    def __in_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        self.__in_order_helper(node.left, arr)
+        arr.append((node.start, node.end))
+        self.__in_order_helper(node.right, arr)
+
+    def pre_order(self) -> list:
+        """
+        Returns (start, end) pairs of the tree in pre-order traversal.
+        """
+
+        arr = []
+        self.__pre_order_helper(self.root, arr)
+        return arr
+
+    def __pre_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        arr.append((node.start, node.end))
+        self.__pre_order_helper(node.left, arr)
+        self.__pre_order_helper(node.right, arr)
+
+    def post_order(self) -> list:
+        """
+        Returns (start, end) pairs of the tree in post-order traversal.
+        """
+
+        arr = []
+        self.__post_order_helper(self.root, arr)
+        return arr
+
+    def __post_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        self.__post_order_helper(node.left, arr)
+        self.__post_order_helper(node.right, arr)
+        arr.append((node.start, node.end))
\ No newline at end of file
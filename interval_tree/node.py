@@ -0,0 +1,11 @@
+class Node:
+
+    def __init__(self, start, end, /):
+
+        self.start = start
+        self.end = end
+        self.max_end = end
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.count = 1
\ No newline at end of file
@@ -0,0 +1 @@
+from .model import OrderStatisticTree
\ No newline at end of file
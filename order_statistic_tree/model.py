@@ -0,0 +1,385 @@
+import math
+from typing import Any
+from .node import Node
+from .exception import Empty
+
+
+class OrderStatisticTree:
+    """
+    AVL Tree whose nodes also store the number of elements in their subtree.
+
+    Every node keeps `size`, the number of elements in its subtree with
+    duplicates counted. Insertion, deletion and the rotations recompute it
+    from the children. `select(k)` can then find the k-th smallest element,
+    and `rank(x)` can count the elements below x, each along a single
+    root-to-leaf path in O(log n).
+
+    Attributes
+    ----------
+    root : Node
+        Root node of the AVL tree.
+    __node_count : int
+        Total number of nodes in the tree (excluding duplicates).
+    """
+
+    def __init__(self):
+
+        self.root = None
+        self.__node_count = 0
+
+    def node_count(self) -> int:
+        """
+        Returns the total number of distinct nodes in the AVL tree,
+        excluding duplicates.
+
+        Returns
+        -------
+        int
+            Number of unique nodes in the tree.
+        """
+
+        return self.__node_count
+
+    def size(self) -> int:
+        """
+        Returns the total number of elements in the AVL tree,
+        including duplicates. Read from the root in O(1).
+
+        Returns
+        -------
+        int
+            Total count of elements stored in the tree.
+        """
+
+        return self.root.size if self.root else 0
+
+    def is_empty(self):
+        """
+        Checks if the AVL tree is empty.
+        Raises an Empty exception if the tree has no nodes.
+        """
+
+        if self.root is None:
+            raise Empty('OrderStatisticTree is empty')
+
+    def insert(self, value: Any, /):
+        """
+        Inserts a new value into the AVL tree.
+        If the value already exists, increments its count.
+        Subtree sizes are refreshed on the way back up, including inside rotations.
+        """
+
+        self.root = self.__insert_helper(self.root, value)
+
+    def __insert_helper(self, node: Node | None, value: Any, /) -> Node:
+        """
+        Helper function for insertion. Works recursively.
+
+        Returns
+        -------
+        Node
+            The updated node (may be the new root after rotation).
+        """
+
+        if node is None:
+            self.__node_count += 1
+            return Node(value)
+        if value < node.value:
+            node.left = self.__insert_helper(node.left, value)
+        elif node.value < value:
+            node.right = self.__insert_helper(node.right, value)
+        else:
+            node.count += 1
+            node.size += 1
+            return node
+        return self.__rebalance(node)
+
+    def delete(self, value: Any, /):
+        """
+        Deletes a value from the AVL tree.
+        Decreases the count if duplicates exist and rebalances after removal.
+        """
+
+        self.is_empty()
+        self.root = self.__delete_helper(self.root, value)
+
+    def __delete_helper(self, node: Node | None, value: Any, /) -> Node | None:
+
+        if node is None:
+            return None
+        if value < node.value:
+            node.left = self.__delete_helper(node.left, value)
+        elif node.value < value:
+            node.right = self.__delete_helper(node.right, value)
+        elif node.count > 1:
+            node.count -= 1
+            node.size -= 1
+            return node
+        elif node.left and node.right:
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.value, node.count = successor.value, successor.count
+            successor.count = 1
+            node.right = self.__delete_helper(node.right, node.value)
+        else:
+            self.__node_count -= 1
+            return node.left or node.right
+        return self.__rebalance(node)
+
+    def __rebalance(self, node: Node, /) -> Node:
+        """
+        Restores the AVL property at `node` and refreshes its height and size.
+
+        Returns
+        -------
+        Node
+            The new root of the subtree.
+        """
+
+        bf = self.get_balance(node)
+        if bf < -1:
+            if self.get_balance(node.right) <= 0: # right-right
+                return self.__rotate_left(node)
+            else: # right-left
+                node.right = self.__rotate_right(node.right)
+                return self.__rotate_left(node)
+        elif 1 < bf:
+            if 0 <= self.get_balance(node.left): # left-left
+                return self.__rotate_right(node)
+            else: # left-right
+                node.left = self.__rotate_left(node.left)
+                return self.__rotate_right(node)
+        self.__update(node)
+        return node
+
+    def __update(self, node: Node, /):
+        """
+        Recomputes the height and subtree size of a node from its children.
+        """
+
+        left, right = node.left, node.right
+        if left:
+            if right:
+                node.height = 1 + (left.height if right.height < left.height else right.height)
+                node.size = left.size + node.count + right.size
+            else:
+                node.height = 1 + left.height
+                node.size = left.size + node.count
+        elif right:
+            node.height = 1 + right.height
+            node.size = node.count + right.size
+        else:
+            node.height = 1
+            node.size = node.count
+
+    def __rotate_left(self, x: Node, /) -> Node:
+        """
+        Performs a Left rotation (RR case).
+
+        Returns
+        -------
+        Node
+            The new root of the rotated subtree.
+        """
+
+        y = x.right
+        x.right = y.left
+        y.left = x
+        self.__update(x)
+        self.__update(y)
+        return y
+
+    def __rotate_right(self, x: Node, /) -> Node:
+        """
+        Performs a Right rotation (LL case).
+
+        Returns
+        -------
+        Node
+            The new root of the rotated subtree.
+        """
+
+        y = x.left
+        x.left = y.right
+        y.right = x
+        self.__update(x)
+        self.__update(y)
+        return y
+
+    def get_balance(self, node: Node | None, /) -> int:
+        """
+        Calculates the balance factor (BF) of a node.
+
+        Returns
+        -------
+        int
+            BF = height(left) - height(right)
+        """
+
+        if node is None:
+            return 0
+        return (node.left.height if node.left else 0) - (node.right.height if node.right else 0)
+
+    def select(self, k: int, /) -> Any:
+        """
+        Returns the k-th smallest element (0-based, duplicates counted).
+        Negative k counts from the largest element, as with list indices.
+
+        Returns
+        -------
+        Any
+            The value at sorted position k.
+        """
+
+        self.is_empty()
+        size = self.root.size
+        if k < 0:
+            k += size
+        if not 0 <= k < size:
+            raise IndexError(f'k must be in [-{size}, {size})')
+        node = self.root
+        while True:
+            left = node.left.size if node.left else 0
+            if k < left:
+                node = node.left
+            elif k < left + node.count:
+                return node.value
+            else:
+                k -= left + node.count
+                node = node.right
+
+    def rank(self, value: Any, /) -> int:
+        """
+        Returns the number of elements strictly smaller than `value`,
+        duplicates counted. `value` does not have to be in the tree.
+
+        Returns
+        -------
+        int
+            Position at which `value` would be inserted before its equals.
+        """
+
+        rank = 0
+        node = self.root
+        while node:
+            if value < node.value:
+                node = node.left
+            elif node.value < value:
+                rank += (node.left.size if node.left else 0) + node.count
+                node = node.right
+            else:
+                return rank + (node.left.size if node.left else 0)
+        return rank
+
+    def quantile(self, q: float, /) -> Any:
+        """
+        Returns the q-quantile, interpolating linearly between the two
+        closest order statistics (numpy.quantile's default method). When the
+        position falls exactly on an element, that element is returned as
+        is, so quantiles of non-numeric values work at those positions.
+
+        Parameters
+        ----------
+        q : float
+            Quantile in [0, 1]; 0.5 is the median, 0.99 the 99th percentile.
+
+        Returns
+        -------
+        Any
+            The interpolated quantile.
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError('q must be in [0, 1]')
+        self.is_empty()
+        position = q * (self.root.size - 1)
+        lo = math.floor(position)
+        fraction = position - lo
+        low = self.select(lo)
+        if fraction == 0:
+            return low
+        high = self.select(lo + 1)
+        return low + (high - low) * fraction
+
+    def median(self) -> Any:
+        """
+        Returns the median: the middle element, or the mean of the two middle
+        elements when the size is even.
+
+        Returns
+        -------
+        Any
+            The median value.
+        """
+
+        return self.quantile(0.5)
+
+    def search(self, value: Any, /) -> Node:
+        """
+        Searches for a value in the AVL tree.
+
+        Returns
+        -------
+        Node | None
+            Returns the node containing the value, or None if not found.
+        """
+
+        current = self.root
+        while current:
+            if value < current.value:
+                current = current.left
+            elif current.value < value:
+                current = current.right
+            else:
+                break
+        return current
+
+    def min(self):
+        """
+        Returns the minimum value in the AVL tree.
+
+        Returns
+        -------
+        Any
+            The minimum value.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.left:
+            current = current.left
+        return current.value
+
+    def max(self):
+        """
+        Returns the maximum value in the AVL tree.
+
+        Returns
+        -------
+        Any
+            The maximum value.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.right:
+            current = current.right
+        return current.value
+
+    def in_order(self) -> list:
+        """
+        Returns values of the tree in in-order traversal.
+        """
+
+        arr = []
+        self.__in_order_helper(self.root, arr)
+        return arr
+
+    def __in_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        self.__in_order_helper(node.left, arr)
+        arr.append(node.value)
+        self.__in_order_helper(node.right, arr)
\ No newline at end of file
@@ -0,0 +1,10 @@
+class Node:
+
+    def __init__(self, value, /):
+
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.count = 1
+        self.size = 1
\ No newline at end of file
@@ -0,0 +1 @@
+from .model import RedBlackTree
\ No newline at end of file
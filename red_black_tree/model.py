@@ -0,0 +1,408 @@
+from typing import Any
+from .node import Node, RED, BLACK
+from .exception import Empty
+
+
+class RedBlackTree:
+    """
+    Red-Black Tree class.
+
+    A red-black tree keeps a looser balance than an AVL tree: every
+    root-to-leaf path holds the same number of black nodes and no red
+    node has a red child. Insertion needs at most two rotations and
+    deletion at most three, which makes it cheaper on write-heavy
+    workloads. Insert, delete and search are iterative; the traversals
+    and is_valid() recurse.
+
+    Attributes
+    ----------
+    root : Node
+        Root node of the red-black tree.
+    __size : int
+        Total number of elements in the tree (including duplicates).
+    __node_count : int
+        Total number of nodes in the tree (excluding duplicates).
+    """
+
+    def __init__(self):
+
+        self.root = None
+        self.__size = 0
+        self.__node_count = 0
+
+    def node_count(self) -> int:
+        """
+        Returns the total number of distinct nodes in the tree,
+        excluding duplicates.
+
+        Returns
+        -------
+        int
+            Number of unique nodes in the tree.
+        """
+
+        return self.__node_count
+
+    def size(self) -> int:
+        """
+        Returns the total number of elements in the tree,
+        including duplicates.
+
+        Returns
+        -------
+        int
+            Total count of elements stored in the tree.
+        """
+
+        return self.__size
+
+    def is_empty(self):
+        """
+        Checks if the red-black tree is empty.
+        Raises an Empty exception if the tree has no nodes.
+        """
+
+        if self.__node_count == 0:
+            raise Empty('RedBlackTree is empty')
+
+    def insert(self, value: Any, /):
+        """
+        Inserts a new value into the red-black tree.
+        If the value already exists, increments its count.
+        After insertion, recolors and rotates to restore the red-black properties.
+        """
+
+        parent = None
+        current = self.root
+        while current:
+            if value < current.value:
+                parent, current = current, current.left
+            elif current.value < value:
+                parent, current = current, current.right
+            else:
+                current.count += 1
+                self.__size += 1
+                return
+        node = Node(value)
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif value < parent.value:
+            parent.left = node
+        else:
+            parent.right = node
+        self.__size += 1
+        self.__node_count += 1
+        self.__insert_fixup(node)
+
+    def __insert_fixup(self, node: Node, /):
+        """
+        Restores the red-black properties after inserting a red node.
+        """
+
+        while node.parent and node.parent.color == RED:
+            parent = node.parent
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if uncle and uncle.color == RED: # recolor
+                    parent.color = uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                    continue
+                if node is parent.right: # left-right
+                    node = parent
+                    self.__rotate_left(node)
+                    parent = node.parent
+                parent.color = BLACK # left-left
+                grandparent.color = RED
+                self.__rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if uncle and uncle.color == RED: # recolor
+                    parent.color = uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                    continue
+                if node is parent.left: # right-left
+                    node = parent
+                    self.__rotate_right(node)
+                    parent = node.parent
+                parent.color = BLACK # right-right
+                grandparent.color = RED
+                self.__rotate_left(grandparent)
+        self.root.color = BLACK
+
+    def delete(self, value: Any, /):
+        """
+        Deletes a value from the red-black tree.
+        Decreases the count if duplicates exist, otherwise unlinks the node
+        and restores the red-black properties.
+        """
+
+        self.is_empty()
+        node = self.__find(value)
+        if node is None:
+            return
+        if node.count > 1:
+            node.count -= 1
+            self.__size -= 1
+            return
+        if node.left and node.right:
+            successor = self.__successor(node.right)
+            node.value, node.count = successor.value, successor.count
+            node = successor
+        child = node.left if node.left else node.right
+        parent = node.parent
+        if child:
+            child.parent = parent
+        self.__replace_child(parent, node, child)
+        if node.color == BLACK:
+            self.__delete_fixup(child, parent)
+        self.__size -= 1
+        self.__node_count -= 1
+
+    def __delete_fixup(self, node: Node | None, parent: Node | None, /):
+        """
+        Restores the red-black properties after removing a black node.
+        `node` carries the extra black and may be None, so its parent is passed explicitly.
+        """
+
+        while node is not self.root and (node is None or node.color == BLACK):
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self.__rotate_left(parent)
+                    sibling = parent.right
+                if self.__is_black(sibling.left) and self.__is_black(sibling.right):
+                    sibling.color = RED
+                    node, parent = parent, parent.parent
+                    continue
+                if self.__is_black(sibling.right):
+                    sibling.left.color = BLACK
+                    sibling.color = RED
+                    self.__rotate_right(sibling)
+                    sibling = parent.right
+                sibling.color = parent.color
+                parent.color = BLACK
+                sibling.right.color = BLACK
+                self.__rotate_left(parent)
+                node = self.root
+            else:
+                sibling = parent.left
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self.__rotate_right(parent)
+                    sibling = parent.left
+                if self.__is_black(sibling.left) and self.__is_black(sibling.right):
+                    sibling.color = RED
+                    node, parent = parent, parent.parent
+                    continue
+                if self.__is_black(sibling.left):
+                    sibling.right.color = BLACK
+                    sibling.color = RED
+                    self.__rotate_left(sibling)
+                    sibling = parent.left
+                sibling.color = parent.color
+                parent.color = BLACK
+                sibling.left.color = BLACK
+                self.__rotate_right(parent)
+                node = self.root
+        if node:
+            node.color = BLACK
+
+    def __is_black(self, node: Node | None, /) -> bool:
+        """
+        Returns True if the node is black. Missing children count as black.
+        """
+
+        return node is None or node.color == BLACK
+
+    def __find(self, value: Any, /) -> Node | None:
+
+        current = self.root
+        while current:
+            if value < current.value:
+                current = current.left
+            elif current.value < value:
+                current = current.right
+            else:
+                break
+        return current
+
+    def __successor(self, node: Node, /) -> Node:
+
+        current = node
+        while current.left:
+            current = current.left
+        return current
+
+    def search(self, value: Any, /) -> Node:
+        """
+        Searches for a value in the red-black tree.
+
+        Returns
+        -------
+        Node | None
+            Returns the node containing the value, or None if not found.
+        """
+
+        return self.__find(value)
+
+    def __replace_child(self, parent: Node | None, old: Node, new: Node | None, /):
+        """
+        Links `new` into the position `old` occupies under `parent`.
+        """
+
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def __rotate_left(self, x: Node, /):
+        """
+        Performs a Left rotation around `x`.
+        """
+
+        y = x.right
+        x.right = y.left
+        if y.left:
+            y.left.parent = x
+        y.parent = x.parent
+        self.__replace_child(x.parent, x, y)
+        y.left = x
+        x.parent = y
+
+    def __rotate_right(self, x: Node, /):
+        """
+        Performs a Right rotation around `x`.
+        """
+
+        y = x.left
+        x.left = y.right
+        if y.right:
+            y.right.parent = x
+        y.parent = x.parent
+        self.__replace_child(x.parent, x, y)
+        y.right = x
+        x.parent = y
+
+    def is_valid(self) -> bool:
+        """
+        Checks that the tree satisfies the red-black properties:
+        black root, no red node with a red child and equal black height on every path.
+
+        Returns
+        -------
+        bool
+            True if all properties hold, False otherwise.
+        """
+
+        if self.root is None:
+            return True
+        if self.root.color == RED:
+            return False
+        return self.__black_height(self.root) != -1
+
+    def __black_height(self, node: Node | None, /) -> int:
+        """
+        Returns the black height of a subtree, or -1 if a property is violated.
+        """
+
+        if node is None:
+            return 1
+        if node.color == RED and not (self.__is_black(node.left) and self.__is_black(node.right)):
+            return -1
+        left = self.__black_height(node.left)
+        right = self.__black_height(node.right)
+        if left == -1 or left != right:
+            return -1
+        return left + (1 if node.color == BLACK else 0)
+
+    def min(self):
+        """
+        Returns the minimum value in the red-black tree.
+
+        Returns
+        -------
+        Any
+            The minimum value.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.left:
+            current = current.left
+        return current.value
+
+    def max(self):
+        """
+        Returns the maximum value in the red-black tree.
+
+        Returns
+        -------
+        Any
+            The maximum value.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.right:
+            current = current.right
+        return current.value
+
+    def in_order(self) -> list:
+        """
+        Returns values of the tree in in-order traversal.
+        """
+
+        arr = []
+        self.__in_order_helper(self.root, arr)
+        return arr
+
+    def __in_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        self.__in_order_helper(node.left, arr)
+        arr.append(node.value)
+        self.__in_order_helper(node.right, arr)
+
+    def pre_order(self) -> list:
+        """
+        Returns values of the tree in pre-order traversal.
+        """
+
+        arr = []
+        self.__pre_order_helper(self.root, arr)
+        return arr
+
+    def __pre_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        arr.append(node.value)
+        self.__pre_order_helper(node.left, arr)
+        self.__pre_order_helper(node.right, arr)
+
+    def post_order(self) -> list:
+        """
+        Returns values of the tree in post-order traversal.
+        """
+
+        arr = []
+        self.__post_order_helper(self.root, arr)
+        return arr
+
+    def __post_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        self.__post_order_helper(node.left, arr)
+        self.__post_order_helper(node.right, arr)
+        arr.append(node.value)
\ No newline at end of file
@@ -0,0 +1,14 @@
+RED = True
+BLACK = False
+
+
+class Node:
+
+    def __init__(self, value, /):
+
+        self.value = value
+        self.left = None
+        self.right = None
+        self.parent = None
+        self.color = RED
+        self.count = 1
\ No newline at end of file
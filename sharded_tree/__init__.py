@@ -0,0 +1 @@
+from .model import ShardedTree
\ No newline at end of file
@@ -0,0 +1,9 @@
+from avl_tree.exception import Empty
+
+
+class ShardError(Exception):
+    pass
+
+
+class ScanInProgress(Exception):
+    pass
\ No newline at end of file
@@ -0,0 +1,353 @@
+import multiprocessing
+from bisect import bisect_right
+from typing import Any, Iterable, Iterator
+from .worker import serve
+from .exception import Empty, ShardError, ScanInProgress
+
+
+class ShardedTree:
+    """
+    Ordered collection range-partitioned across worker processes, each
+    owning its own AVLTree.
+
+    The router keeps `boundaries`, a sorted list of split keys. Shard i
+    holds the values v with boundaries[i - 1] <= v < boundaries[i]. Point
+    operations go to a single shard. Batched operations and scans are
+    sent to every shard involved before any reply is read, so the shards
+    work in parallel. Because shards are disjoint and ordered, their
+    sorted streams merge by concatenation. When one shard grows past
+    `skew` times the mean shard size, `rebalance()` recomputes the
+    boundaries from the global key distribution and redistributes the data.
+    An automatic rebalance only runs again once the total size has doubled
+    since the last one, so skew that splitting cannot fix (one hot key)
+    costs O(1) amortized per insert instead of a full reload every time.
+
+    Attributes
+    ----------
+    boundaries : list
+        Split keys between consecutive shards.
+    __connections : list
+        Router end of the pipe to every worker.
+    __processes : list
+        Worker processes.
+    __sizes : list
+        Elements per shard (including duplicates), tracked by the router.
+    __skew : float
+        Largest shard / mean shard size ratio that triggers a rebalance.
+    __min_rebalance_size : int
+        Total size below which automatic rebalancing is skipped.
+    __rebalanced_at : int
+        Total size after the last rebalance, lowered by deletes; the next
+        automatic rebalance waits until the total reaches twice this.
+    __scanning : bool
+        True while a scan() stream is open; the pipes then carry its chunks.
+    """
+
+    def __init__(
+        self,
+        shards: int = 4,
+        *,
+        boundaries: list | None = None,
+        skew: float = 2.0,
+        min_rebalance_size: int = 1024,
+    ):
+
+        if shards < 1:
+            raise ValueError('shards must be at least 1')
+        if boundaries is not None and (len(boundaries) != shards - 1 or boundaries != sorted(boundaries)):
+            raise ValueError('boundaries must be shards - 1 sorted split keys')
+        self.boundaries = list(boundaries) if boundaries is not None else []
+        self.__skew = skew
+        self.__min_rebalance_size = min_rebalance_size
+        self.__shards = shards
+        self.__sizes = [0] * shards
+        self.__rebalanced_at = 0
+        self.__scanning = False
+        self.__connections = []
+        self.__processes = []
+        for _ in range(shards):
+            router, worker = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=serve, args=(worker,), daemon=True)
+            process.start()
+            worker.close()
+            self.__connections.append(router)
+            self.__processes.append(process)
+
+    def __enter__(self) -> 'ShardedTree':
+
+        return self
+
+    def __exit__(self, *exc):
+
+        self.close()
+
+    def close(self):
+        """
+        Stops every worker process.
+        """
+
+        for shard in range(len(self.__connections)):
+            self.__send(shard, ('stop', None))
+        for connection, process in zip(self.__connections, self.__processes):
+            connection.recv()
+            connection.close()
+            process.join()
+        self.__connections = []
+        self.__processes = []
+
+    def __shard(self, value: Any, /) -> int:
+
+        if not self.boundaries:
+            return 0
+        return bisect_right(self.boundaries, value)
+
+    def __send(self, shard: int, message: tuple, /):
+        """
+        Sends a message to a worker. Refuses while a scan is open, because its
+        unread chunks are still queued on the pipes and would be taken as replies.
+        """
+
+        if self.__scanning:
+            raise ScanInProgress('finish or close the open scan() before calling the tree again')
+        self.__connections[shard].send(message)
+
+    def __reply(self, shard: int, /) -> Any:
+
+        status, result = self.__connections[shard].recv()
+        if status == 'error':
+            raise ShardError(f'shard {shard} failed') from result
+        return result
+
+    def __call(self, shard: int, command: str, args: Any = None, /) -> Any:
+
+        self.__send(shard, (command, args))
+        return self.__reply(shard)
+
+    def __broadcast(self, command: str, shards: Iterable[int] | None = None, /) -> list:
+        """
+        Sends a command to several shards and collects the replies in shard order.
+        """
+
+        shards = list(range(self.__shards)) if shards is None else list(shards)
+        for shard in shards:
+            self.__send(shard, (command, None))
+        return [self.__reply(shard) for shard in shards]
+
+    def __group(self, values: Iterable[Any], /) -> dict:
+        """
+        Groups values by owning shard, keeping their order within each shard.
+        """
+
+        groups = {}
+        for index, value in enumerate(values):
+            groups.setdefault(self.__shard(value), []).append((index, value))
+        return groups
+
+    def size(self) -> int:
+        """
+        Returns the total number of elements across shards, including duplicates.
+        """
+
+        return sum(self.__sizes)
+
+    def node_count(self) -> int:
+        """
+        Returns the number of distinct values across shards.
+        """
+
+        return sum(node_count for _, node_count in self.__broadcast('size'))
+
+    def shard_sizes(self) -> list:
+        """
+        Returns the number of elements held by each shard.
+        """
+
+        return list(self.__sizes)
+
+    def is_empty(self):
+        """
+        Raises an Empty exception if no shard holds any element.
+        """
+
+        if sum(self.__sizes) == 0:
+            raise Empty('ShardedTree is empty')
+
+    def insert(self, value: Any, /):
+        """
+        Inserts a value into the shard that owns it.
+        """
+
+        shard = self.__shard(value)
+        self.__call(shard, 'insert', [value])
+        self.__sizes[shard] += 1
+        self.__maybe_rebalance()
+
+    def insert_many(self, values: Iterable[Any], /):
+        """
+        Inserts a batch of values with one message per shard; the shards insert in parallel.
+        """
+
+        groups = self.__group(values)
+        for shard, group in groups.items():
+            self.__send(shard, ('insert', [value for _, value in group]))
+        for shard, group in groups.items():
+            self.__reply(shard)
+            self.__sizes[shard] += len(group)
+        self.__maybe_rebalance()
+
+    def delete(self, value: Any, /):
+        """
+        Deletes one occurrence of a value from the shard that owns it.
+        """
+
+        self.is_empty()
+        shard = self.__shard(value)
+        if self.__call(shard, 'delete', value):
+            self.__sizes[shard] -= 1
+            self.__rebalanced_at = min(self.__rebalanced_at, sum(self.__sizes))
+
+    def count(self, value: Any, /) -> int:
+        """
+        Returns the number of duplicates stored for a value (0 if absent).
+        """
+
+        return self.__call(self.__shard(value), 'count', [value])[0]
+
+    def count_many(self, values: Iterable[Any], /) -> list:
+        """
+        Looks up a batch of values with one message per shard, answered in parallel.
+
+        Returns
+        -------
+        list
+            The count of every value, in input order.
+        """
+
+        values = list(values)
+        groups = self.__group(values)
+        for shard, group in groups.items():
+            self.__send(shard, ('count', [value for _, value in group]))
+        counts = [0] * len(values)
+        for shard, group in groups.items():
+            for (index, _), count in zip(group, self.__reply(shard)):
+                counts[index] = count
+        return counts
+
+    def __contains__(self, value: Any, /) -> bool:
+
+        return self.count(value) > 0
+
+    def min(self) -> Any:
+        """
+        Returns the minimum value: the minimum of the first non-empty shard.
+        """
+
+        self.is_empty()
+        shard = next(i for i, size in enumerate(self.__sizes) if size)
+        return self.__call(shard, 'min')
+
+    def max(self) -> Any:
+        """
+        Returns the maximum value: the maximum of the last non-empty shard.
+        """
+
+        self.is_empty()
+        shard = next(i for i in range(self.__shards - 1, -1, -1) if self.__sizes[i])
+        return self.__call(shard, 'max')
+
+    def scan(self, lo: Any = None, hi: Any = None, /) -> Iterator[tuple]:
+        """
+        Streams (value, count) pairs with lo <= value <= hi in sorted order.
+        A bound left as None is open. The request goes to every overlapping
+        shard up front, and their chunked replies are read back in shard order.
+        Until the generator is exhausted or closed, every other call on the
+        tree raises ScanInProgress; use range() to get a list instead.
+        """
+
+        first = 0 if lo is None else self.__shard(lo)
+        last = self.__shards - 1 if hi is None else self.__shard(hi)
+        shards = [shard for shard in range(first, last + 1) if self.__sizes[shard]]
+        for shard in shards:
+            self.__send(shard, ('scan', (lo, hi)))
+        yield from self.__stream(shards)
+
+    def __stream(self, shards: list, /) -> Iterator[tuple]:
+        """
+        Reads the chunked replies of several shards in order. If the consumer
+        stops early, the unread replies are discarded so the pipes stay in step.
+        """
+
+        pending = list(shards)
+        self.__scanning = True
+        try:
+            while pending:
+                status, result = self.__connections[pending[0]].recv()
+                if status == 'chunk':
+                    yield from result
+                    continue
+                shard = pending.pop(0)
+                if status == 'error':
+                    raise ShardError(f'shard {shard} failed') from result
+        finally:
+            for shard in pending:
+                while self.__connections[shard].recv()[0] == 'chunk':
+                    pass
+            self.__scanning = False
+
+    def range(self, lo: Any, hi: Any, /) -> list:
+        """
+        Returns the distinct values v with lo <= v <= hi in sorted order.
+        """
+
+        return [value for value, _ in self.scan(lo, hi)]
+
+    def in_order(self) -> list:
+        """
+        Returns all distinct values in sorted order, merged from every shard.
+        """
+
+        return [value for value, _ in self.scan()]
+
+    def __maybe_rebalance(self):
+
+        total = sum(self.__sizes)
+        if self.__shards == 1 or total < max(self.__min_rebalance_size, 2 * self.__rebalanced_at):
+            return
+        if max(self.__sizes) > self.__skew * total / self.__shards:
+            self.rebalance()
+
+    def rebalance(self):
+        """
+        Recomputes the boundaries so every shard holds about the same number
+        of elements, then redistributes the data. Every shard is drained in
+        parallel, and the boundaries are placed at equal-weight points of the
+        merged sorted stream. This stops the world and costs O(n).
+        """
+
+        shards = list(range(self.__shards))
+        for shard in shards:
+            self.__send(shard, ('drain', (None, None)))
+        items = list(self.__stream(shards))
+        total = sum(count for _, count in items)
+        target = total / self.__shards
+        boundaries = []
+        seen = 0
+        for value, count in items:
+            if len(boundaries) == self.__shards - 1:
+                break
+            if seen >= target * (len(boundaries) + 1) and (not boundaries or boundaries[-1] < value):
+                boundaries.append(value)
+            seen += count
+        if items:
+            boundaries += [items[-1][0]] * (self.__shards - 1 - len(boundaries))
+        self.boundaries = boundaries
+        groups = {}
+        for value, count in items:
+            groups.setdefault(self.__shard(value), []).append((value, count))
+        self.__sizes = [0] * self.__shards
+        for shard, group in groups.items():
+            self.__send(shard, ('load', group))
+        for shard, group in groups.items():
+            self.__reply(shard)
+            self.__sizes[shard] = sum(count for _, count in group)
+        self.__rebalanced_at = total
\ No newline at end of file
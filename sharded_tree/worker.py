@@ -0,0 +1,89 @@
+from typing import Any, Iterator
+from avl_tree import AVLTree
+
+
+CHUNK = 4096
+
+
+def items(tree: AVLTree, lo: Any = None, hi: Any = None, /) -> Iterator[tuple]:
+    """
+    Iterative in-order walk yielding (value, count) for live nodes with
+    lo <= value <= hi. Subtrees outside the bounds are skipped, and a bound left as None is open.
+    """
+
+    stack = []
+    current = tree.root
+    while stack or current:
+        while current:
+            if lo is not None and current.value < lo:
+                current = current.right
+                continue
+            stack.append(current)
+            current = current.left
+        if not stack:
+            return
+        current = stack.pop()
+        if hi is not None and hi < current.value:
+            return
+        if current.count:
+            yield current.value, current.count
+        current = current.right
+
+
+def serve(connection, /):
+    """
+    Worker process main loop. Owns one AVLTree and answers (command, args)
+    messages from the router with ('ok', result) or ('error', exception).
+    Scans stream back as ('chunk', [(value, count), ...]) messages followed by ('ok', None).
+    """
+
+    tree = AVLTree()
+    while True:
+        command, args = connection.recv()
+        try:
+            if command == 'stop':
+                connection.send(('ok', None))
+                return
+            if command in ('scan', 'drain'):
+                chunk = []
+                for item in items(tree, *args):
+                    chunk.append(item)
+                    if len(chunk) == CHUNK:
+                        connection.send(('chunk', chunk))
+                        chunk = []
+                if chunk:
+                    connection.send(('chunk', chunk))
+                if command == 'drain':
+                    tree = AVLTree()
+                result = None
+            elif command == 'insert':
+                for value in args:
+                    tree.insert(value)
+                result = None
+            elif command == 'load':
+                for value, count in args:
+                    for _ in range(count):
+                        tree.insert(value)
+                result = None
+            elif command == 'delete':
+                node = tree.search(args)
+                if node is not None:
+                    tree.delete(args)
+                result = node is not None
+            elif command == 'count':
+                result = []
+                for value in args:
+                    node = tree.search(value)
+                    result.append(node.count if node else 0)
+            elif command == 'min':
+                result = tree.min() if tree.node_count() else None
+            elif command == 'max':
+                result = tree.max() if tree.node_count() else None
+            elif command == 'size':
+                result = tree.size(), tree.node_count()
+            else:
+                raise ValueError(f'unknown command {command!r}')
+        except Exception as error:
+            connection.send(('error', error))
+            continue
+        connection.send(('ok', result))
\ No newline at end of file
@@ -0,0 +1 @@
+from .model import SlidingWindow
\ No newline at end of file
@@ -0,0 +1 @@
+from order_statistic_tree.exception import Empty
\ No newline at end of file
@@ -0,0 +1,230 @@
+import math
+import time
+from bisect import bisect_right
+from collections import deque
+from typing import Any, Callable, Iterable
+from order_statistic_tree import OrderStatisticTree
+
+
+class SlidingWindow:
+    """
+    Rolling order statistics (median, quantiles, ranks) over the most
+    recent events of a stream.
+
+    Every event is inserted into an OrderStatisticTree and appended to a
+    FIFO queue. Once the window holds more than `size` events, or an event
+    is older than `duration` (relative to the newest timestamp seen), it is
+    popped from the front of the queue and deleted from the tree. Updates
+    and every query are O(log n) in the window length.
+
+    Attributes
+    ----------
+    tree : OrderStatisticTree
+        The values currently in the window.
+    __size : int | None
+        Maximum number of events in the window, or None for no count bound.
+    __duration : float | None
+        Time span of the window, or None for no time bound.
+    __clock : Callable[[], float]
+        Time source for events pushed without a timestamp.
+    __values : deque
+        Values in arrival order.
+    __times : deque
+        Timestamps in arrival order (time-bounded windows only).
+    __now : float
+        Newest timestamp seen; the window covers (now - duration, now].
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        *,
+        duration: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+
+        if size is None and duration is None:
+            raise ValueError('a size or a duration is required')
+        if size is not None and size < 1:
+            raise ValueError('size must be at least 1')
+        if duration is not None and not 0 < duration:
+            raise ValueError('duration must be positive')
+        self.tree = OrderStatisticTree()
+        self.__size = size
+        self.__duration = duration
+        self.__clock = clock
+        self.__values = deque()
+        self.__times = deque()
+        self.__now = -math.inf
+
+    def size(self) -> int:
+        """
+        Returns the number of events currently in the window.
+        """
+
+        return len(self.__values)
+
+    def __advance(self, timestamp: float | None, /) -> float:
+        """
+        Moves the window's clock forward to `timestamp` (or the clock's reading) and returns it.
+        """
+
+        if timestamp is None:
+            timestamp = self.__clock()
+        if timestamp < self.__now:
+            raise ValueError('timestamps must not decrease')
+        self.__now = timestamp
+        return timestamp
+
+    def __as_list(self, chunk: Iterable[Any], /) -> list:
+        """
+        Converts a chunk to a list of Python objects. NumPy arrays (and
+        array.array, pandas Series, ...) are converted in one `tolist()`
+        call, without importing NumPy here.
+        """
+
+        tolist = getattr(chunk, 'tolist', None)
+        return tolist() if tolist is not None else list(chunk)
+
+    def push(self, value: Any, timestamp: float | None = None, /):
+        """
+        Adds one event and expires the events that fall out of the window.
+
+        Parameters
+        ----------
+        value : Any
+            The observed value.
+        timestamp : float | None
+            Event time for time-bounded windows; defaults to the clock. Must not decrease.
+        """
+
+        if self.__duration is not None:
+            self.__times.append(self.__advance(timestamp))
+        self.tree.insert(value)
+        self.__values.append(value)
+        self.__expire()
+
+    def extend(self, values: Iterable[Any], timestamps: Iterable[float] | None = None, /):
+        """
+        Adds a chunk of events, such as a NumPy array, and expires old ones.
+        Events that would already be out of the window by the end of the
+        chunk are never inserted: only the last `size` events, and only
+        those newer than (last timestamp - duration), reach the tree.
+
+        Parameters
+        ----------
+        values : Iterable[Any]
+            Observed values in arrival order.
+        timestamps : Iterable[float] | None
+            Non-decreasing event times, one per value, for time-bounded windows.
+            When omitted, the whole chunk is stamped with one clock reading.
+        """
+
+        values = self.__as_list(values)
+        if not values:
+            return
+        start = 0
+        if self.__duration is not None:
+            if timestamps is None:
+                stamps = [self.__advance(None)] * len(values)
+            else:
+                stamps = self.__as_list(timestamps)
+                if len(stamps) != len(values):
+                    raise ValueError('values and timestamps must have the same length')
+                if any(b < a for a, b in zip(stamps, stamps[1:])):
+                    raise ValueError('timestamps must not decrease')
+                self.__advance(stamps[0])
+                self.__advance(stamps[-1])
+            start = bisect_right(stamps, self.__now - self.__duration)
+        if self.__size is not None:
+            start = max(start, len(values) - self.__size)
+        insert = self.tree.insert
+        for value in values[start:]:
+            insert(value)
+        self.__values.extend(values[start:])
+        if self.__duration is not None:
+            self.__times.extend(stamps[start:])
+        self.__expire()
+
+    def rolling(self, values: Iterable[Any], q: float = 0.5, timestamps: Iterable[float] | None = None, /) -> list:
+        """
+        Pushes a chunk of events one by one and records the q-quantile of the
+        window after each of them, e.g. a rolling median over a series.
+
+        Returns
+        -------
+        list
+            One quantile per event, in input order.
+        """
+
+        values = self.__as_list(values)
+        stamps = self.__as_list(timestamps) if timestamps is not None else [None] * len(values)
+        if len(stamps) != len(values):
+            raise ValueError('values and timestamps must have the same length')
+        quantiles = []
+        for value, timestamp in zip(values, stamps):
+            self.push(value, timestamp)
+            quantiles.append(self.tree.quantile(q))
+        return quantiles
+
+    def expire(self, now: float | None = None, /):
+        """
+        Advances a time-bounded window to `now` (default: the clock) without
+        adding an event, dropping everything older than now - duration.
+        """
+
+        if self.__duration is None:
+            return
+        self.__advance(now)
+        self.__expire()
+
+    def __expire(self):
+
+        values, times, tree = self.__values, self.__times, self.tree
+        if self.__size is not None:
+            while len(values) > self.__size:
+                tree.delete(values.popleft())
+                if times:
+                    times.popleft()
+        if self.__duration is not None:
+            cutoff = self.__now - self.__duration
+            while times and times[0] <= cutoff:
+                times.popleft()
+                tree.delete(values.popleft())
+
+    def median(self) -> Any:
+        """
+        Returns the median of the window (the mean of the two middle values for an even size).
+        Raises Empty if the window is empty.
+        """
+
+        return self.tree.median()
+
+    def quantile(self, q: float, /) -> Any:
+        """
+        Returns the q-quantile of the window, interpolated like numpy.quantile.
+        Raises Empty if the window is empty.
+        """
+
+        return self.tree.quantile(q)
+
+    def rank(self, value: Any, /) -> int:
+        """
+        Returns the number of events in the window with a value strictly smaller than `value`.
+        """
+
+        return self.tree.rank(value)
+
+    def min(self) -> Any:
+        """
+        Returns the smallest value in the window.
+        """
+
+        return self.tree.min()
+
+    def max(self) -> Any:
+        """
+        Returns the largest value in the window.
+        """
+
+        return self.tree.max()
\ No newline at end of file
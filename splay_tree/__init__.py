@@ -0,0 +1 @@
+from .model import SplayTree
\ No newline at end of file
@@ -0,0 +1,273 @@
+from typing import Any
+from .node import Node
+from .exception import Empty
+
+
+class SplayTree:
+    """
+    Splay Tree class.
+
+    Every access moves the touched node to the root with an iterative
+    top-down splay, so frequently and recently used values stay near the
+    top. Operations cost O(log n) amortized and much less under skewed
+    access. The tree keeps no balance information and may be deep at
+    times, so every walk here, traversals included, is iterative.
+
+    Attributes
+    ----------
+    root : Node
+        Root node of the splay tree.
+    __size : int
+        Total number of elements in the tree (including duplicates).
+    __node_count : int
+        Total number of nodes in the tree (excluding duplicates).
+    __header : Node
+        Scratch node reused by every splay to collect the left and right trees.
+    """
+
+    def __init__(self):
+
+        self.root = None
+        self.__size = 0
+        self.__node_count = 0
+        self.__header = Node(None)
+
+    def node_count(self) -> int:
+        """
+        Returns the total number of distinct nodes in the splay tree,
+        excluding duplicates.
+
+        Returns
+        -------
+        int
+            Number of unique nodes in the tree.
+        """
+
+        return self.__node_count
+
+    def size(self) -> int:
+        """
+        Returns the total number of elements in the splay tree,
+        including duplicates.
+
+        Returns
+        -------
+        int
+            Total count of elements stored in the tree.
+        """
+
+        return self.__size
+
+    def is_empty(self):
+        """
+        Checks if the splay tree is empty.
+        Raises an Empty exception if the tree has no nodes.
+        """
+
+        if self.__node_count == 0:
+            raise Empty('SplayTree is empty')
+
+    def __splay(self, node: Node, value: Any, /) -> Node:
+        """
+        Top-down splay. Brings the node holding `value`, or the last node on
+        its search path, to the root of the subtree rooted at `node`.
+
+        Returns
+        -------
+        Node
+            The new root of the subtree.
+        """
+
+        header = self.__header
+        header.left = header.right = None
+        left = right = header
+        while True:
+            if value < node.value:
+                if node.left is None:
+                    break
+                if value < node.left.value: # zig-zig: rotate right
+                    y = node.left
+                    node.left = y.right
+                    y.right = node
+                    node = y
+                    if node.left is None:
+                        break
+                right.left = node # link right
+                right = node
+                node = node.left
+            elif node.value < value:
+                if node.right is None:
+                    break
+                if node.right.value < value: # zag-zag: rotate left
+                    y = node.right
+                    node.right = y.left
+                    y.left = node
+                    node = y
+                    if node.right is None:
+                        break
+                left.right = node # link left
+                left = node
+                node = node.right
+            else:
+                break
+        left.right = node.left
+        right.left = node.right
+        node.left = header.right
+        node.right = header.left
+        return node
+
+    def insert(self, value: Any, /):
+        """
+        Inserts a new value into the splay tree.
+        If the value already exists, increments its count.
+        The inserted value becomes the root.
+        """
+
+        self.__size += 1
+        if self.root is None:
+            self.root = Node(value)
+            self.__node_count += 1
+            return
+        root = self.__splay(self.root, value)
+        if not (value < root.value or root.value < value):
+            root.count += 1
+            self.root = root
+            return
+        node = Node(value)
+        if value < root.value:
+            node.left = root.left
+            node.right = root
+            root.left = None
+        else:
+            node.right = root.right
+            node.left = root
+            root.right = None
+        self.root = node
+        self.__node_count += 1
+
+    def delete(self, value: Any, /):
+        """
+        Deletes a value from the splay tree.
+        Decreases the count if duplicates exist, otherwise splays the value to
+        the root and joins its two subtrees.
+        """
+
+        self.is_empty()
+        root = self.__splay(self.root, value)
+        self.root = root
+        if value < root.value or root.value < value:
+            return
+        self.__size -= 1
+        if root.count > 1:
+            root.count -= 1
+            return
+        if root.left is None:
+            self.root = root.right
+        else:
+            # value is larger than everything on the left, so this brings its max up
+            self.root = self.__splay(root.left, value)
+            self.root.right = root.right
+        self.__node_count -= 1
+
+    def search(self, value: Any, /) -> Node:
+        """
+        Searches for a value in the splay tree and splays the last node reached to the root.
+
+        Returns
+        -------
+        Node | None
+            Returns the node containing the value, or None if not found.
+        """
+
+        if self.root is None:
+            return None
+        if not (value < self.root.value or self.root.value < value):
+            return self.root
+        self.root = self.__splay(self.root, value)
+        if value < self.root.value or self.root.value < value:
+            return None
+        return self.root
+
+    def min(self):
+        """
+        Returns the minimum value in the splay tree and splays it to the root.
+
+        Returns
+        -------
+        Any
+            The minimum value.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.left:
+            current = current.left
+        self.root = self.__splay(self.root, current.value)
+        return current.value
+
+    def max(self):
+        """
+        Returns the maximum value in the splay tree and splays it to the root.
+
+        Returns
+        -------
+        Any
+            The maximum value.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.right:
+            current = current.right
+        self.root = self.__splay(self.root, current.value)
+        return current.value
+
+    def in_order(self) -> list:
+        """
+        Returns values of the tree in in-order traversal.
+        """
+
+        arr = []
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            arr.append(current.value)
+            current = current.right
+        return arr
+
+    def pre_order(self) -> list:
+        """
+        Returns values of the tree in pre-order traversal.
+        """
+
+        arr = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            arr.append(node.value)
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+        return arr
+
+    def post_order(self) -> list:
+        """
+        Returns values of the tree in post-order traversal.
+        """
+
+        arr = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            arr.append(node.value)
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        arr.reverse()
+        return arr
\ No newline at end of file
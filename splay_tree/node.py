@@ -0,0 +1,8 @@
+class Node:
+
+    def __init__(self, value, /):
+
+        self.value = value
+        self.count = 1
+        self.left = None
+        self.right = None
\ No newline at end of file
@@ -0,0 +1 @@
+from .model import Treap
\ No newline at end of file
@@ -0,0 +1,271 @@
+from typing import Any
+from .node import Node
+from .exception import Empty
+
+
+class Treap:
+    """
+    Treap (randomized binary search tree) class.
+
+    Every node gets a random priority and the tree is kept as a heap on
+    priorities, which gives an expected height of O(log n) without any
+    stored balance information. An insertion costs at most the rotations
+    needed to lift the new node, and a deletion rotates the node down to
+    a leaf; both average fewer than two rotations.
+
+    Attributes
+    ----------
+    root : Node
+        Root node of the treap.
+    __size : int
+        Total number of elements in the tree (including duplicates).
+    __node_count : int
+        Total number of nodes in the tree (excluding duplicates).
+    """
+
+    def __init__(self):
+
+        self.root = None
+        self.__size = 0
+        self.__node_count = 0
+
+    def node_count(self) -> int:
+        """
+        Returns the total number of distinct nodes in the treap,
+        excluding duplicates.
+
+        Returns
+        -------
+        int
+            Number of unique nodes in the tree.
+        """
+
+        return self.__node_count
+
+    def size(self) -> int:
+        """
+        Returns the total number of elements in the treap,
+        including duplicates.
+
+        Returns
+        -------
+        int
+            Total count of elements stored in the tree.
+        """
+
+        return self.__size
+
+    def is_empty(self):
+        """
+        Checks if the treap is empty.
+        Raises an Empty exception if the tree has no nodes.
+        """
+
+        if self.__node_count == 0:
+            raise Empty('Treap is empty')
+
+    def insert(self, value: Any, /):
+        """
+        Inserts a new value into the treap.
+        If the value already exists, increments its count.
+        A new node is rotated up while its priority is higher than its parent's.
+        """
+
+        self.root = self.__insert_helper(self.root, value)
+
+    def __insert_helper(self, node: Node | None, value: Any, /) -> Node:
+        """
+        Helper function for insertion. Works recursively.
+
+        Returns
+        -------
+        Node
+            The updated node (may be the new root after rotation).
+        """
+
+        if node is None:
+            self.__size += 1
+            self.__node_count += 1
+            return Node(value)
+        if value < node.value:
+            node.left = self.__insert_helper(node.left, value)
+            if node.priority < node.left.priority:
+                return self.__rotate_right(node)
+        elif node.value < value:
+            node.right = self.__insert_helper(node.right, value)
+            if node.priority < node.right.priority:
+                return self.__rotate_left(node)
+        else:
+            node.count += 1
+            self.__size += 1
+        return node
+
+    def delete(self, value: Any, /):
+        """
+        Deletes a value from the treap.
+        Decreases the count if duplicates exist, otherwise rotates the node
+        down to a leaf and removes it.
+        """
+
+        self.is_empty()
+        self.root = self.__delete_helper(self.root, value)
+
+    def __delete_helper(self, node: Node | None, value: Any, /) -> Node | None:
+
+        if node is None:
+            return None
+        if value < node.value:
+            node.left = self.__delete_helper(node.left, value)
+        elif node.value < value:
+            node.right = self.__delete_helper(node.right, value)
+        elif node.count > 1:
+            node.count -= 1
+            self.__size -= 1
+        elif node.left is None:
+            self.__size -= 1
+            self.__node_count -= 1
+            return node.right
+        elif node.right is None:
+            self.__size -= 1
+            self.__node_count -= 1
+            return node.left
+        elif node.left.priority < node.right.priority:
+            node = self.__rotate_left(node)
+            node.left = self.__delete_helper(node.left, value)
+        else:
+            node = self.__rotate_right(node)
+            node.right = self.__delete_helper(node.right, value)
+        return node
+
+    def search(self, value: Any, /) -> Node:
+        """
+        Searches for a value in the treap.
+
+        Returns
+        -------
+        Node | None
+            Returns the node containing the value, or None if not found.
+        """
+
+        current = self.root
+        while current:
+            if value < current.value:
+                current = current.left
+            elif current.value < value:
+                current = current.right
+            else:
+                break
+        return current
+
+    def __rotate_left(self, x: Node, /) -> Node:
+        """
+        Performs a Left rotation.
+
+        Returns
+        -------
+        Node
+            The new root of the rotated subtree.
+        """
+
+        y = x.right
+        x.right = y.left
+        y.left = x
+        return y
+
+    def __rotate_right(self, x: Node, /) -> Node:
+        """
+        Performs a Right rotation.
+
+        Returns
+        -------
+        Node
+            The new root of the rotated subtree.
+        """
+
+        y = x.left
+        x.left = y.right
+        y.right = x
+        return y
+
+    def min(self):
+        """
+        Returns the minimum value in the treap.
+
+        Returns
+        -------
+        Any
+            The minimum value.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.left:
+            current = current.left
+        return current.value
+
+    def max(self):
+        """
+        Returns the maximum value in the treap.
+
+        Returns
+        -------
+        Any
+            The maximum value.
+        """
+
+        self.is_empty()
+        current = self.root
+        while current.right:
+            current = current.right
+        return current.value
+
+    def in_order(self) -> list:
+        """
+        Returns values of the tree in in-order traversal.
+        """
+
+        arr = []
+        self.__in_order_helper(self.root, arr)
+        return arr
+
+    def __in_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        self.__in_order_helper(node.left, arr)
+        arr.append(node.value)
+        self.__in_order_helper(node.right, arr)
+
+    def pre_order(self) -> list:
+        """
+        Returns values of the tree in pre-order traversal.
+        """
+
+        arr = []
+        self.__pre_order_helper(self.root, arr)
+        return arr
+
+    def __pre_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        arr.append(node.value)
+        self.__pre_order_helper(node.left, arr)
+        self.__pre_order_helper(node.right, arr)
+
+    def post_order(self) -> list:
+        """
+        Returns values of the tree in post-order traversal.
+        """
+
+        arr = []
+        self.__post_order_helper(self.root, arr)
+        return arr
+
+    def __post_order_helper(self, node: Node, arr: list, /):
+
+        if node is None:
+            return
+        self.__post_order_helper(node.left, arr)
+        self.__post_order_helper(node.right, arr)
+        arr.append(node.value)
\ No newline at end of file
@@ -0,0 +1,12 @@
+import random
+
+
+class Node:
+
+    def __init__(self, value, /):
+
+        self.value = value
+        self.left = None
+        self.right = None
+        self.priority = random.random()
+        self.count = 1
\ No newline at end of file